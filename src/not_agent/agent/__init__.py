@@ -12,6 +12,7 @@ from .message import (
     ToolResultPart,
     part_from_dict,
     part_from_anthropic,
+    parts_to_api,
     register_part_type,
 )
 from .permissions import (
@@ -36,6 +37,7 @@ __all__ = [
     "ToolResultPart",
     "part_from_dict",
     "part_from_anthropic",
+    "parts_to_api",
     "register_part_type",
     # Permissions
     "Permission",
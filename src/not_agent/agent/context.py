@@ -32,22 +32,28 @@ class ContextManager:
         # Rough estimate: 1 token per 4 characters
         return len(text) // 4
 
-    def should_compact(self, session: "Session") -> bool:
-        """Check if compaction is needed."""
+    def should_compact(self, session: "Session", tokens: int | None = None) -> bool:
+        """Check if compaction is needed.
+
+        Pass ``tokens`` to reuse an estimate already made for this session.
+        """
         # Check minimum message count
         if len(session) <= self.preserve_recent_messages + 2:
             return False
 
-        tokens = self.estimate_tokens(session)
+        if tokens is None:
+            tokens = self.estimate_tokens(session)
         return tokens >= self.limit * self.threshold
 
     def get_usage_ratio(self, session: "Session") -> float:
         """Return context usage ratio."""
         return self.estimate_tokens(session) / self.limit
 
-    def get_usage_info(self, session: "Session") -> dict[str, Any]:
-        """Return context usage info."""
-        token_count = self.estimate_tokens(session)
+    def get_usage_info(
+        self, session: "Session", tokens: int | None = None
+    ) -> dict[str, Any]:
+        """Return context usage info, reusing ``tokens`` if given."""
+        token_count = self.estimate_tokens(session) if tokens is None else tokens
         percentage = (token_count / self.limit) * 100
 
         return {
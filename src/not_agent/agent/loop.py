@@ -8,7 +8,14 @@ from anthropic.types import Message, ToolUseBlock, TextBlock
 from rich.console import Console
 
 from not_agent.config import Config
-from not_agent.provider import get_provider, BaseProvider
+from not_agent.provider import (
+    BaseProvider,
+    SlidingWindowLimiter,
+    call_with_backoff,
+    get_provider,
+    limiter_from_config,
+)
+from not_agent.provider.ratelimit import BACKOFF_ATTEMPTS
 from not_agent.tools import ToolResult, TodoManager, get_all_tools
 from not_agent.core import (
     Event,
@@ -45,6 +52,7 @@ class AgentLoop:
         event_bus: EventBus | None = None,
         executor: ToolExecutor | None = None,
         todo_manager: TodoManager | None = None,
+        limiter: SlidingWindowLimiter | None = None,
     ) -> None:
         # Config setup (create default if not provided)
         self.config = config or Config()
@@ -57,6 +65,8 @@ class AgentLoop:
             self.config.get("provider", "claude"),
             self.config
         )
+        # Client-side rate limit, charged once per LLM request
+        self.limiter = limiter or limiter_from_config(self.config)
 
         # Settings (loaded from Config)
         self.max_turns: int = self.config.get("max_turns", 20)
@@ -82,6 +92,9 @@ class AgentLoop:
         )
 
         self.system_prompt = self._get_system_prompt()
+        # Session token estimate from the last context check; None once the
+        # session has changed since (see _session_tokens)
+        self._context_tokens: int | None = None
 
         # Spinner callbacks (set in run())
         self.pause_spinner_callback: Any = None
@@ -225,12 +238,13 @@ When unsure about requirements, use ask_user."""
         # Initialize context
         self.context.reset()
         self.context.max_turns = self.max_turns
-        self.context.start_time = time.time()
+        self.context.start_time = time.monotonic_ns()
 
         try:
             # Receive input
             self._set_state(LoopState.RECEIVING_INPUT)
             self.session.add_user_message(user_message)
+            self._context_tokens = None
 
             # Loop started event
             self._emit(LoopStartedEvent(
@@ -292,7 +306,7 @@ When unsure about requirements, use ask_user."""
                     text_response = "\n".join(text_content)
 
                     # Loop completed event
-                    duration_ms = (time.time() - self.context.start_time) * 1000
+                    duration_ms = self.context.duration_ms() or 0.0
                     self._emit(LoopCompletedEvent(
                         session_id=self.session.id,
                         termination_reason=termination.name,
@@ -367,7 +381,7 @@ When unsure about requirements, use ask_user."""
             self._set_state(LoopState.COMPLETED)
 
             # Loop completed event (max turns)
-            duration_ms = (time.time() - self.context.start_time) * 1000
+            duration_ms = self.context.duration_ms() or 0.0
             self._emit(LoopCompletedEvent(
                 session_id=self.session.id,
                 termination_reason=TerminationReason.MAX_TURNS.name,
@@ -388,7 +402,7 @@ When unsure about requirements, use ask_user."""
             raise
 
         finally:
-            self.context.end_time = time.time()
+            self.context.end_time = time.monotonic_ns()
 
     def _call_llm(self) -> Message:
         """Call the LLM with current messages."""
@@ -426,7 +440,12 @@ When unsure about requirements, use ask_user."""
                             self._debug_log(f"  #{i} {role.upper()}: {text[:100]}...")
 
         try:
-            response = self.provider.chat(
+            # Retry just this request; the session already holds this turn
+            response = call_with_backoff(
+                self.provider.chat,
+                limiter=self.limiter,
+                tokens=self._session_tokens() + len(self.system_prompt) // 4,
+                wait=self._wait_rate_limited,
                 messages=messages,
                 system=self.system_prompt,
                 tools=self.executor.get_tool_definitions(),
@@ -482,6 +501,18 @@ When unsure about requirements, use ask_user."""
             self._debug_box("[ERROR] Unexpected Error", messages=[str(e)])
             raise
 
+    def _wait_rate_limited(self, delay: float, attempt: int) -> None:
+        """Wait before retrying a rate-limited request, pausing the spinner."""
+        if self.pause_spinner_callback:
+            self.pause_spinner_callback()
+        _debug_console.print(
+            f"[yellow]Rate limited, retrying in {delay:.1f}s "
+            f"({attempt + 1}/{BACKOFF_ATTEMPTS - 1})...[/yellow]"
+        )
+        time.sleep(delay)
+        if self.resume_spinner_callback:
+            self.resume_spinner_callback()
+
     def _format_tool_result(self, result: ToolResult) -> str:
         """Format a tool result for the LLM."""
         if result.success:
@@ -503,20 +534,33 @@ When unsure about requirements, use ask_user."""
                 )
             return error_output
 
+    def _session_tokens(self) -> int:
+        """Return the session token estimate, computing it at most once per turn."""
+        if self._context_tokens is None:
+            self._context_tokens = self.context_manager.estimate_tokens(self.session)
+        return self._context_tokens
+
     def _check_context_size(self) -> None:
         """Check and warn if context is getting large."""
+        # The session grew this turn; this estimate is reused by the next request
+        self._context_tokens = None
+        tokens = self._session_tokens()
+
         # Auto-compact if threshold reached
         enable_auto_compaction = self.config.get("enable_auto_compaction", True)
-        if enable_auto_compaction and self.context_manager.should_compact(self.session):
+        if enable_auto_compaction and self.context_manager.should_compact(
+            self.session, tokens
+        ):
             self.context_manager.compact(
                 session=self.session,
                 system_prompt=self.system_prompt,
                 debug_log=self._debug_log if self.debug else None,
             )
+            self._context_tokens = None
             return
 
         # Warnings
-        usage = self.context_manager.get_usage_info(self.session)
+        usage = self.context_manager.get_usage_info(self.session, tokens)
         token_count = usage["current"]
         max_tokens = usage["max"]
 
@@ -533,3 +577,4 @@ When unsure about requirements, use ask_user."""
     def reset(self) -> None:
         """Reset the conversation history."""
         self.session.clear()
+        self._context_tokens = None
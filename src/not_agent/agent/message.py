@@ -4,9 +4,10 @@ Defines a type-safe message part hierarchy.
 Compatible with Anthropic API while remaining extensible.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Literal, Any, TypeVar
+from typing import Any, Callable, Literal, TypeVar
 
 
 class MessagePart(ABC):
@@ -15,6 +16,10 @@ class MessagePart(ABC):
     All message parts must inherit from this class.
     """
 
+    # Memoized to_api_format() result; parts are never mutated
+    __slots__ = ("_cached_api",)
+    _cached_api: dict[str, Any]  # Set lazily by _api_format_cached()
+
     @property
     @abstractmethod
     def part_type(self) -> str:
@@ -37,8 +42,21 @@ class MessagePart(ABC):
         """Restore from dictionary."""
         pass
 
+    def _api_format_cached(self) -> dict[str, Any]:
+        """to_api_format(), computed once per part.
+
+        The returned dict is shared; callers must not mutate it.
+        """
+        try:
+            return self._cached_api
+        except AttributeError:
+            cached = self.to_api_format()
+            # object.__setattr__ bypasses frozen dataclass guards
+            object.__setattr__(self, "_cached_api", cached)
+            return cached
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextPart(MessagePart):
     """Text message part."""
 
@@ -56,10 +74,10 @@ class TextPart(MessagePart):
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TextPart":
-        return cls(text=data["text"])
+        return _make_text(data["text"])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolUsePart(MessagePart):
     """Tool call part.
 
@@ -70,6 +88,10 @@ class ToolUsePart(MessagePart):
     tool_name: str
     tool_input: dict[str, Any]
 
+    def __post_init__(self) -> None:
+        # Tool names repeat across the session; share one string object
+        object.__setattr__(self, "tool_name", sys.intern(self.tool_name))
+
     @property
     def part_type(self) -> Literal["tool_use"]:
         return "tool_use"
@@ -99,7 +121,7 @@ class ToolUsePart(MessagePart):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolResultPart(MessagePart):
     """Tool execution result part.
 
@@ -141,6 +163,15 @@ class ToolResultPart(MessagePart):
         )
 
 
+# Shared empty text part (parts are immutable, so one instance suffices)
+_EMPTY_TEXT = TextPart(text="")
+
+
+def _make_text(text: str) -> TextPart:
+    """Create a TextPart, reusing the shared instance for empty text."""
+    return _EMPTY_TEXT if not text else TextPart(text=text)
+
+
 # Part type registry
 _PART_TYPES: dict[str, type[MessagePart]] = {
     "text": TextPart,
@@ -172,9 +203,64 @@ def part_from_dict(data: dict[str, Any]) -> MessagePart:
         ValueError: Unknown part_type
     """
     part_type = data.get("part_type")
-    if part_type not in _PART_TYPES:
+    cls = _PART_TYPES.get(part_type)  # type: ignore[arg-type]
+    if cls is None:
         raise ValueError(f"Unknown part type: {part_type}")
-    return _PART_TYPES[part_type].from_dict(data)
+    return cls.from_dict(data)
+
+
+# Anthropic SDK block converters (TextBlock, ToolUseBlock)
+def _text_from_sdk(block: Any) -> MessagePart:
+    return _make_text(block.text)
+
+
+def _sdk_tool_input(tool_input: Any) -> dict[str, Any]:
+    # SDK inputs are usually plain dicts already; share them instead of copying
+    if isinstance(tool_input, dict):
+        return tool_input
+    return dict(tool_input) if tool_input else {}
+
+
+def _tool_use_from_sdk(block: Any) -> MessagePart:
+    return ToolUsePart(
+        tool_id=block.id,
+        tool_name=block.name,
+        tool_input=_sdk_tool_input(block.input),
+    )
+
+
+# dict block converters (tool_result or API format)
+def _text_from_dict(block: dict[str, Any]) -> MessagePart:
+    return _make_text(block.get("text", ""))
+
+
+def _tool_use_from_dict(block: dict[str, Any]) -> MessagePart:
+    return ToolUsePart(
+        tool_id=block["id"],
+        tool_name=block["name"],
+        tool_input=block.get("input", {}),
+    )
+
+
+def _tool_result_from_dict(block: dict[str, Any]) -> MessagePart:
+    return ToolResultPart(
+        tool_use_id=block["tool_use_id"],
+        content=block.get("content", ""),
+        is_error=block.get("is_error", False),
+    )
+
+
+# Block "type" -> converter dispatch tables
+_SDK_DISPATCH: dict[str, Callable[[Any], MessagePart]] = {
+    "text": _text_from_sdk,
+    "tool_use": _tool_use_from_sdk,
+}
+
+_DICT_DISPATCH: dict[str, Callable[[dict[str, Any]], MessagePart]] = {
+    "text": _text_from_dict,
+    "tool_use": _tool_use_from_dict,
+    "tool_result": _tool_result_from_dict,
+}
 
 
 def part_from_anthropic(block: Any) -> MessagePart:
@@ -189,36 +275,17 @@ def part_from_anthropic(block: Any) -> MessagePart:
     Raises:
         ValueError: Cannot convert block
     """
-    # Anthropic SDK objects (TextBlock, ToolUseBlock)
-    if hasattr(block, "type"):
-        if block.type == "text":
-            return TextPart(text=block.text)
-        elif block.type == "tool_use":
-            return ToolUsePart(
-                tool_id=block.id,
-                tool_name=block.name,
-                tool_input=dict(block.input) if block.input else {},
-            )
-
-    # dict format (tool_result or API format)
-    if isinstance(block, dict):
-        block_type = block.get("type")
-        if block_type == "tool_result":
-            return ToolResultPart(
-                tool_use_id=block["tool_use_id"],
-                content=block.get("content", ""),
-                is_error=block.get("is_error", False),
-            )
-        elif block_type == "text":
-            return TextPart(text=block.get("text", ""))
-        elif block_type == "tool_use":
-            return ToolUsePart(
-                tool_id=block["id"],
-                tool_name=block["name"],
-                tool_input=block.get("input", {}),
-            )
-
-    raise ValueError(f"Cannot convert to MessagePart: {type(block)} - {block}")
+    block_type = getattr(block, "type", None)
+    if block_type is not None:
+        convert = _SDK_DISPATCH.get(block_type)
+    elif isinstance(block, dict):
+        convert = _DICT_DISPATCH.get(block.get("type", ""))
+    else:
+        convert = None
+
+    if convert is None:
+        raise ValueError(f"Cannot convert to MessagePart: {type(block)} - {block}")
+    return convert(block)
 
 
 def parts_from_content(content: list[Any] | str) -> list[MessagePart]:
@@ -231,13 +298,69 @@ def parts_from_content(content: list[Any] | str) -> list[MessagePart]:
         List of MessageParts
     """
     if isinstance(content, str):
-        return [TextPart(text=content)]
+        return [_make_text(content)]
 
-    parts = []
+    sdk_dispatch = _SDK_DISPATCH.get
+    dict_dispatch = _DICT_DISPATCH.get
+    parts: list[MessagePart] = []
+    append = parts.append
     for block in content:
-        try:
-            parts.append(part_from_anthropic(block))
-        except ValueError:
-            # On conversion failure, treat as text
-            parts.append(TextPart(text=str(block)))
+        block_type = getattr(block, "type", None)
+        if block_type is not None:
+            convert = sdk_dispatch(block_type)
+        elif isinstance(block, dict):
+            convert = dict_dispatch(block.get("type", ""))
+        else:
+            convert = None
+        # On conversion failure, treat as text
+        append(convert(block) if convert is not None else TextPart(text=str(block)))
     return parts
+
+
+# Anthropic SDK block -> API dict converters (no MessagePart in between)
+def _text_sdk_to_api(block: Any) -> dict[str, Any]:
+    return {"type": "text", "text": block.text}
+
+
+def _tool_use_sdk_to_api(block: Any) -> dict[str, Any]:
+    return {
+        "type": "tool_use",
+        "id": block.id,
+        "name": block.name,
+        "input": _sdk_tool_input(block.input),
+    }
+
+
+_SDK_API_DISPATCH: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "text": _text_sdk_to_api,
+    "tool_use": _tool_use_sdk_to_api,
+}
+
+
+def parts_to_api(blocks: list[Any]) -> list[dict[str, Any]]:
+    """Convert content blocks directly to Anthropic API format.
+
+    Fast path for callers that only need API dicts: skips building
+    MessageParts. dict blocks are assumed to already be in API format.
+
+    Args:
+        blocks: Anthropic SDK blocks or API-format dicts
+
+    Returns:
+        List of API-format content dicts
+    """
+    sdk_dispatch = _SDK_API_DISPATCH.get
+    result: list[dict[str, Any]] = []
+    append = result.append
+    for block in blocks:
+        if isinstance(block, dict):
+            append(block)
+            continue
+        convert = sdk_dispatch(getattr(block, "type", None))  # type: ignore[arg-type]
+        # On conversion failure, treat as text
+        append(
+            convert(block)
+            if convert is not None
+            else {"type": "text", "text": str(block)}
+        )
+    return result
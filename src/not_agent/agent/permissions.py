@@ -7,26 +7,49 @@ A system for determining automatic approval/denial/prompting before tool executi
 - PermissionManager: Rule evaluation and user prompting
 """
 
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable
+from array import array
+from bisect import insort
+from dataclasses import dataclass, field
+from enum import IntEnum
+from os.path import basename as _basename
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 import fnmatch
+import re
 
 if TYPE_CHECKING:
     from not_agent.config import Config
 
 
-class Permission(Enum):
-    """Permission decision type."""
+class Permission(IntEnum):
+    """Permission decision type (int-valued for cheap comparison)."""
 
-    ALLOW = auto()  # Auto approve
-    DENY = auto()   # Auto deny
-    ASK = auto()    # Ask user
+    ALLOW = 1  # Auto approve
+    DENY = 2   # Auto deny
+    ASK = 3    # Ask user
 
 
-@dataclass
+# Raw values for the check() fast path
+_ALLOW = Permission.ALLOW.value
+_DENY = Permission.DENY.value
+
+# _format_diff line prefixes
+_DIFF_HEADERS = ("+++", "---", "@@")
+_P_HDR = "  "
+_P_ADD = "  + "
+_P_DEL = "  - "
+_P_CTX = "    "
+
+# Context fields a rule needs present (see PermissionRule._needs)
+_PATH_BIT = 1
+_CMD_BIT = 2
+
+
+@dataclass(frozen=True)
 class PermissionRule:
-    """Permission rule definition."""
+    """Permission rule definition.
+
+    Frozen so the flags precomputed in __post_init__ can't go stale.
+    """
 
     # Matching conditions
     tool_pattern: str = "*"              # "write", "bash", "read", "*"
@@ -40,30 +63,39 @@ class PermissionRule:
     description: str = ""
     priority: int = 0  # Higher priority evaluated first
 
+    # Context fields the patterns require (_PATH_BIT | _CMD_BIT)
+    _needs: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        needs = (_PATH_BIT if self.path_pattern else 0) | (
+            _CMD_BIT if self.command_pattern else 0
+        )
+        object.__setattr__(self, "_needs", needs)
+
     def matches(self, tool_name: str, context: dict[str, Any]) -> bool:
         """Check if rule matches the current request."""
+        path = context.get("file_path") or context.get("path")
+        command = context.get("command")
+
+        # Reject before any pattern matching if a required field is missing
+        ctx_bits = (_PATH_BIT if path else 0) | (_CMD_BIT if command else 0)
+        if self._needs & ~ctx_bits:
+            return False
+
         # Tool name matching
         if not fnmatch.fnmatch(tool_name, self.tool_pattern):
             return False
 
         # Path matching (for file-related tools)
         if self.path_pattern:
-            path = context.get("file_path") or context.get("path")
-            if not path:
-                return False
             # Also check path basename (when pattern is filename only)
             if not fnmatch.fnmatch(path, self.path_pattern):
                 # Try with basename
-                from pathlib import Path
-                basename = Path(path).name
-                if not fnmatch.fnmatch(basename, self.path_pattern):
+                if not fnmatch.fnmatch(_basename(path), self.path_pattern):
                     return False
 
         # Command matching (for bash tool)
         if self.command_pattern:
-            command = context.get("command")
-            if not command:
-                return False
             if not fnmatch.fnmatch(command, self.command_pattern):
                 return False
 
@@ -96,6 +128,100 @@ class PermissionRule:
         )
 
 
+def _rule_sort_key(rule: PermissionRule) -> int:
+    """Sort key placing higher-priority rules first."""
+    return -rule.priority
+
+
+# (tool_name, path, command, context) -> Permission
+Matcher = Callable[[str, str | None, str | None, dict[str, Any]], Permission]
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _pattern_test(pattern: str, var: str, name: str, ns: dict[str, Any]) -> str:
+    """Build an expression testing `var` against an fnmatch pattern.
+
+    Literals become ==, "prefix*" becomes startswith, anything else
+    a precompiled regex. Values are bound in `ns` under `name`.
+    """
+    if pattern == "*":
+        return "True"
+    if not _GLOB_CHARS.intersection(pattern):
+        ns[name] = pattern
+        return f"{var} == {name}"
+    if pattern.endswith("*") and not _GLOB_CHARS.intersection(pattern[:-1]):
+        ns[name] = pattern[:-1]
+        return f"{var}.startswith({name})"
+    ns[name] = re.compile(fnmatch.translate(pattern)).match
+    return f"{name}({var}) is not None"
+
+
+def _compile_matcher(rules: Sequence[PermissionRule]) -> Matcher:
+    """Generate a single function evaluating `rules` in order.
+
+    Equivalent to returning the permission of the first rule whose
+    matches() is true, falling back to ASK.
+    """
+    ns: dict[str, Any] = {"_ASK": Permission.ASK, "_basename": _basename}
+    lines = ["def _m(tool, path, cmd, ctx):"]
+
+    for i, rule in enumerate(rules):
+        ns[f"_p{i}"] = rule.permission
+
+        # Subclasses may override matches(); call it as-is
+        if type(rule) is not PermissionRule:
+            ns[f"_r{i}"] = rule
+            lines.append(f"    if _r{i}.matches(tool, ctx): return _p{i}")
+            continue
+
+        # Cheapest first: presence of required fields, then patterns
+        conds = []
+        if rule.path_pattern:
+            conds.append("path")
+        if rule.command_pattern:
+            conds.append("cmd")
+        tool_test = _pattern_test(rule.tool_pattern, "tool", f"_t{i}", ns)
+        if tool_test != "True":
+            conds.append(tool_test)
+        if rule.path_pattern:
+            full = _pattern_test(rule.path_pattern, "path", f"_a{i}", ns)
+            base = _pattern_test(rule.path_pattern, "_basename(path)", f"_a{i}", ns)
+            conds.append(f"({full} or {base})")
+        if rule.command_pattern:
+            conds.append(_pattern_test(rule.command_pattern, "cmd", f"_c{i}", ns))
+
+        if not conds:
+            # Unconditional rule: later rules are unreachable
+            lines.append(f"    return _p{i}")
+            break
+        lines.append(f"    if {' and '.join(conds)}: return _p{i}")
+    else:
+        lines.append("    return _ASK")
+
+    exec(compile("\n".join(lines), "<permission-rules>", "exec"), ns)
+    matcher: Matcher = ns["_m"]
+    return matcher
+
+
+def _build_always(
+    rules: Sequence[PermissionRule], matcher: Matcher
+) -> dict[str, Permission]:
+    """Precompute decisions for literal tool names given no path/command.
+
+    Without a path or command only unconditional rules can match, so
+    the result depends on the tool name alone. Skipped when a rule
+    subclass may inspect other context keys.
+    """
+    if any(type(rule) is not PermissionRule for rule in rules):
+        return {}
+    return {
+        rule.tool_pattern: matcher(rule.tool_pattern, None, None, {})
+        for rule in rules
+        if not _GLOB_CHARS.intersection(rule.tool_pattern)
+    }
+
+
 class PermissionManager:
     """Rule-based permission manager."""
 
@@ -221,6 +347,14 @@ class PermissionManager:
             priority=-1000,
         ),
     ]
+    # Presorted and precompiled once; shared read-only by instances
+    # that use only the defaults. A tuple, so it cannot be changed
+    # under the matcher built from it.
+    _DEFAULT_SORTED: tuple[PermissionRule, ...] = tuple(
+        sorted(DEFAULT_RULES, key=_rule_sort_key)
+    )
+    _DEFAULT_MATCHER = staticmethod(_compile_matcher(_DEFAULT_SORTED))
+    _DEFAULT_ALWAYS = _build_always(_DEFAULT_SORTED, _DEFAULT_MATCHER.__func__)
 
     def __init__(
         self,
@@ -240,35 +374,66 @@ class PermissionManager:
         """
         self.enabled = enabled
         self.show_diff = show_diff
-        self.rules: list[PermissionRule] = []
-
-        if use_default_rules:
-            self.rules.extend(self.DEFAULT_RULES)
-
-        if rules:
-            self.rules.extend(rules)
-
-        # Sort by priority (higher first)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
-
-        # History
-        self.history: list[tuple[str, Permission]] = []
+        # Rules in evaluation order; the shared default tuple until
+        # add_rule() forks a private list
+        self._rules: list[PermissionRule] | tuple[PermissionRule, ...]
+        # Generated from self._rules on first evaluate()
+        self._matcher: Matcher | None
+        # tool name -> permission when context has no path/command
+        self._always: dict[str, Permission] = {}
+
+        if use_default_rules and not rules:
+            self._rules = self._DEFAULT_SORTED
+            self._matcher = self._DEFAULT_MATCHER
+            self._always = self._DEFAULT_ALWAYS
+        else:
+            own = list(self._DEFAULT_SORTED) if use_default_rules else []
+            if rules:
+                own.extend(rules)
+            # Sort by priority (higher first)
+            own.sort(key=_rule_sort_key)
+            self._rules = own
+            self._matcher = None
+
+        # History (column-oriented: tool name, details, permission value)
+        self._hist_tool: list[str] = []
+        self._hist_details: list[str] = []
+        self._hist_perm: array[int] = array("B")
 
         # Spinner callbacks (set by CLI)
         self.pause_spinner: Callable[[], None] | None = None
         self.resume_spinner: Callable[[], None] | None = None
 
+    @property
+    def rules(self) -> tuple[PermissionRule, ...]:
+        """Rules in evaluation order (read-only; use add_rule())."""
+        return tuple(self._rules)
+
     def add_rule(self, rule: PermissionRule) -> None:
-        """Add rule and re-sort."""
-        self.rules.append(rule)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+        """Insert rule keeping priority order (after equal priorities)."""
+        rules = self._rules
+        if isinstance(rules, tuple):
+            rules = self._rules = list(rules)
+        insort(rules, rule, key=_rule_sort_key)
+        self._matcher = None
+
+    def _compile(self) -> Matcher:
+        """Regenerate the matcher and precomputed decisions from rules."""
+        matcher = self._matcher = _compile_matcher(self._rules)
+        self._always = _build_always(self._rules, matcher)
+        return matcher
 
     def evaluate(self, tool_name: str, context: dict[str, Any]) -> Permission:
         """Evaluate rules in order to determine permission."""
-        for rule in self.rules:
-            if rule.matches(tool_name, context):
-                return rule.permission
-        return Permission.ASK
+        matcher = self._matcher
+        if matcher is None:
+            matcher = self._compile()
+        return matcher(
+            tool_name,
+            context.get("file_path") or context.get("path"),
+            context.get("command"),
+            context,
+        )
 
     def check(
         self,
@@ -292,19 +457,34 @@ class PermissionManager:
         if not self.enabled:
             return True
 
-        permission = self.evaluate(tool_name, context)
+        if self._matcher is None:
+            self._compile()
 
-        if permission == Permission.ALLOW:
-            self.history.append((f"{tool_name}: {details}", permission))
+        permission: Permission | None = None
+        if not (
+            context.get("file_path") or context.get("path") or context.get("command")
+        ):
+            permission = self._always.get(tool_name)
+        if permission is None:
+            permission = self.evaluate(tool_name, context)
+
+        if permission == _ALLOW:
+            self.record(tool_name, details, permission)
             return True
 
-        if permission == Permission.DENY:
-            self.history.append((f"{tool_name}: {details}", permission))
+        if permission == _DENY:
+            self.record(tool_name, details, permission)
             return False
 
         # Permission.ASK: prompt user
         return self._ask_user(tool_name, details, diff)
 
+    def record(self, tool_name: str, details: str, permission: Permission) -> None:
+        """Record a decision in the history."""
+        self._hist_tool.append(tool_name)
+        self._hist_details.append(details)
+        self._hist_perm.append(permission.value)
+
     def _ask_user(self, tool_name: str, details: str, diff: str | None) -> bool:
         """Request approval from user."""
         if self.pause_spinner:
@@ -323,16 +503,16 @@ class PermissionManager:
                 try:
                     response = input("   Approve? [y/n]: ").strip().lower()
                     if response in ["y", "yes"]:
-                        self.history.append((f"{tool_name}: {details}", Permission.ALLOW))
+                        self.record(tool_name, details, Permission.ALLOW)
                         return True
                     elif response in ["n", "no"]:
-                        self.history.append((f"{tool_name}: {details}", Permission.DENY))
+                        self.record(tool_name, details, Permission.DENY)
                         return False
                     else:
                         print("   Invalid input. Please enter 'y' or 'n'")
                 except (EOFError, KeyboardInterrupt):
                     print("\n   Cancelled. Denying permission.")
-                    self.history.append((f"{tool_name}: {details}", Permission.DENY))
+                    self.record(tool_name, details, Permission.DENY)
                     return False
         finally:
             if self.resume_spinner:
@@ -340,27 +520,48 @@ class PermissionManager:
 
     def _format_diff(self, diff: str) -> str:
         """Format diff for display."""
-        lines = []
+        out: list[str] = []
+        append = out.append
         for line in diff.splitlines():
-            if line.startswith("+++") or line.startswith("---"):
-                lines.append(f"  {line}")
-            elif line.startswith("@@"):
-                lines.append(f"  {line}")
-            elif line.startswith("+"):
-                lines.append(f"  + {line[1:]}")
-            elif line.startswith("-"):
-                lines.append(f"  - {line[1:]}")
+            if line.startswith(_DIFF_HEADERS):
+                append(_P_HDR)
+                append(line)
+            elif line[:1] == "+":
+                append(_P_ADD)
+                append(line[1:])
+            elif line[:1] == "-":
+                append(_P_DEL)
+                append(line[1:])
             else:
-                lines.append(f"    {line}")
-        return "\n".join(lines)
+                append(_P_CTX)
+                append(line)
+            append("\n")
+        if out:
+            out.pop()  # No newline after the last line
+        return "".join(out)
+
+    @property
+    def history(self) -> tuple[tuple[str, Permission], ...]:
+        """Legacy: History as (description, permission) tuples.
+
+        A read-only snapshot; use record() and clear_history() to change it.
+        """
+        return tuple(self.get_history())
 
     def get_history(self) -> list[tuple[str, Permission]]:
         """Return history."""
-        return self.history.copy()
+        return [
+            (f"{tool}: {details}", Permission(value))
+            for tool, details, value in zip(
+                self._hist_tool, self._hist_details, self._hist_perm
+            )
+        ]
 
     def clear_history(self) -> None:
         """Clear history."""
-        self.history.clear()
+        self._hist_tool.clear()
+        self._hist_details.clear()
+        del self._hist_perm[:]
 
     @classmethod
     def from_config(cls, config: "Config") -> "PermissionManager":
@@ -3,9 +3,11 @@
 Session management module using type-safe message system.
 """
 
+import secrets
+import sys
+import warnings
 from dataclasses import dataclass, field
-from typing import Literal, Any, TYPE_CHECKING
-from uuid import uuid4
+from typing import Literal, Any, Sequence, TYPE_CHECKING
 
 from .message import (
     MessagePart,
@@ -18,19 +20,65 @@ from .message import (
 )
 
 
-@dataclass
+# Part class -> Message bucket attribute
+_BUCKETS: dict[type[MessagePart], str] = {
+    TextPart: "_text_parts",
+    ToolUsePart: "_tool_uses",
+    ToolResultPart: "_tool_results",
+}
+
+
+@dataclass(slots=True)
 class Message:
     """Type-safe conversation message.
 
-    All message content consists of MessageParts.
+    All message content consists of MessageParts. ``parts`` is stored as
+    a tuple so the caches below can only change through add_part().
     """
 
     role: Literal["user", "assistant"]
-    parts: list[MessagePart] = field(default_factory=list)
+    parts: Sequence[MessagePart] = field(default_factory=tuple)
+
+    # Memoized to_api_format() result, reset by add_part()
+    _api_cached: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Parts bucketed by type, maintained by add_part()
+    _text_parts: list[TextPart] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _tool_uses: list[ToolUsePart] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _tool_results: list[ToolResultPart] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Roles restored from JSON are fresh strings; share the literal
+        self.role = sys.intern(self.role)  # type: ignore[assignment]
+        self.parts = tuple(self.parts)
+        for part in self.parts:
+            self._bucket(part)
+
+    def _bucket(self, part: MessagePart) -> None:
+        """Append part to the bucket list for its type."""
+        attr = _BUCKETS.get(type(part))
+        if attr is None:
+            # Subclass of a built-in part type (or a custom part)
+            attr = next(
+                (a for cls, a in _BUCKETS.items() if isinstance(part, cls)), None
+            )
+            if attr is None:
+                return
+        getattr(self, attr).append(part)
 
     def add_part(self, part: MessagePart) -> None:
         """Add a part."""
-        self.parts.append(part)
+        self.parts = (*self.parts, part)
+        self._bucket(part)
+        self._api_cached = None
 
     def get_parts_by_type(self, part_type: type[MessagePart]) -> list[MessagePart]:
         """Return only parts of a specific type.
@@ -41,21 +89,30 @@ class Message:
         Returns:
             List of parts of the specified type
         """
+        attr = _BUCKETS.get(part_type)
+        if attr is not None:
+            return list(getattr(self, attr))
         return [p for p in self.parts if isinstance(p, part_type)]
 
     def get_text_content(self) -> str:
         """Join and return all text parts."""
-        text_parts = self.get_parts_by_type(TextPart)
-        return "\n".join(p.text for p in text_parts)  # type: ignore
+        return "\n".join(p.text for p in self._text_parts)
 
     def get_tool_uses(self) -> list[ToolUsePart]:
         """Return all tool call parts."""
-        return [p for p in self.parts if isinstance(p, ToolUsePart)]
+        return list(self._tool_uses)
 
     def to_api_format(self) -> dict[str, Any]:
-        """Convert to Anthropic API format."""
-        content = [part.to_api_format() for part in self.parts]
-        return {"role": self.role, "content": content}
+        """Convert to Anthropic API format.
+
+        The result is cached until add_part() is called; callers must
+        not mutate it.
+        """
+        cached = self._api_cached
+        if cached is None:
+            content = [part._api_format_cached() for part in self.parts]
+            cached = self._api_cached = {"role": self.role, "content": content}
+        return cached
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -79,17 +136,31 @@ class Message:
     # Backward compatibility: content property
     @property
     def content(self) -> list[Any]:
-        """Legacy: Return content in API format."""
-        return [part.to_api_format() for part in self.parts]
+        """Legacy: Return content in API format.
+
+        Deprecated; use ``parts``. Shares the cached to_api_format()
+        content list, so callers must not mutate it.
+        """
+        warnings.warn(
+            "Message.content is deprecated; use Message.parts",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.to_api_format()["content"]  # type: ignore[no-any-return]
 
 
 class Session:
     """Type-safe conversation session management."""
 
     def __init__(self) -> None:
-        self.id: str = str(uuid4())
+        self.id: str = secrets.token_hex(16)
         self.messages: list[Message] = []
 
+    def _append(self, msg: Message) -> Message:
+        """Append a message."""
+        self.messages.append(msg)
+        return msg
+
     def add_user_message(self, content: str | list[MessagePart]) -> Message:
         """Add user message.
 
@@ -104,9 +175,7 @@ class Session:
         else:
             parts = content
 
-        msg = Message(role="user", parts=parts)
-        self.messages.append(msg)
-        return msg
+        return self._append(Message(role="user", parts=parts))
 
     def add_assistant_message(self, content: list[Any]) -> Message:
         """Add assistant message (from Anthropic response).
@@ -117,10 +186,7 @@ class Session:
         Returns:
             Added Message
         """
-        parts = [part_from_anthropic(block) for block in content]
-        msg = Message(role="assistant", parts=parts)
-        self.messages.append(msg)
-        return msg
+        return self._append(Message.from_anthropic_response("assistant", content))
 
     def add_tool_results(self, results: list[dict[str, Any]]) -> Message:
         """Add tool results as user message.
@@ -131,23 +197,26 @@ class Session:
         Returns:
             Added Message
         """
-        parts: list[MessagePart] = []
-        for result in results:
-            parts.append(
-                ToolResultPart(
-                    tool_use_id=result["tool_use_id"],
-                    content=result.get("content", ""),
-                    is_error=result.get("is_error", False),
-                )
-            )
-
-        msg = Message(role="user", parts=parts)
-        self.messages.append(msg)
-        return msg
+        make = ToolResultPart
+        parts: list[MessagePart] = [
+            make(r["tool_use_id"], r.get("content", ""), r.get("is_error", False))
+            for r in results
+        ]
+        return self._append(Message(role="user", parts=parts))
 
     def to_api_format(self) -> list[dict[str, Any]]:
-        """Convert to API call format."""
-        return [msg.to_api_format() for msg in self.messages]
+        """Convert to API call format.
+
+        Built from each message's cached API form, so unchanged messages
+        are not converted again. The message dicts and content lists are
+        fresh copies; the part dicts inside are shared and must not be
+        mutated.
+        """
+        out = []
+        for msg in self.messages:
+            api = msg.to_api_format()
+            out.append({"role": api["role"], "content": list(api["content"])})
+        return out
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -176,26 +245,15 @@ class Session:
         Args:
             messages: List of messages in Anthropic API format
         """
-        self.messages = []
-        for msg_dict in messages:
-            role = msg_dict["role"]
-            content = msg_dict["content"]
-
-            # If string
-            if isinstance(content, str):
-                self.messages.append(
-                    Message(role=role, parts=[TextPart(text=content)])  # type: ignore
-                )
-                continue
-
-            # If list
-            parts = parts_from_content(content)
-            self.messages.append(Message(role=role, parts=parts))  # type: ignore
+        self.messages = [
+            Message(role=m["role"], parts=parts_from_content(m["content"]))
+            for m in messages
+        ]
 
     def clear(self) -> None:
         """Clear session."""
         self.messages.clear()
-        self.id = str(uuid4())
+        self.id = secrets.token_hex(16)
 
     def __len__(self) -> int:
         """Return message count."""
@@ -3,11 +3,19 @@
 Defines enum and context classes for agent loop state management.
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any
+import os
 import time
 
+# Maximum number of state transitions kept in LoopContext history.
+STATE_HISTORY_LIMIT = 256
+
+# State history is only recorded when NOT_AGENT_DEBUG_STATES is set.
+_DEBUG_STATES = bool(os.environ.get("NOT_AGENT_DEBUG_STATES"))
+
 
 class LoopState(Enum):
     """Current state of agent loop."""
@@ -22,6 +30,11 @@ class LoopState(Enum):
     ERROR = auto()              # Error occurred
 
 
+# State membership bitmasks, indexed by LoopState.value.
+_FINISHED_MASK = (1 << LoopState.COMPLETED.value) | (1 << LoopState.ERROR.value)
+_NOT_RUNNING_MASK = _FINISHED_MASK | (1 << LoopState.IDLE.value)
+
+
 class TerminationReason(Enum):
     """Loop termination reason."""
 
@@ -33,7 +46,12 @@ class TerminationReason(Enum):
     TOOL_STOP = auto()          # Tool requested stop (e.g., exit command)
 
 
-@dataclass
+# Enum names indexed by value (auto() starts at 1), for to_dict()
+_STATE_NAMES: list[str | None] = [None] + [s.name for s in LoopState]
+_TERM_NAMES: list[str | None] = [None] + [r.name for r in TerminationReason]
+
+
+@dataclass(slots=True)
 class LoopContext:
     """Current loop execution context.
 
@@ -54,35 +72,35 @@ class LoopContext:
     # Statistics
     total_tool_calls: int = 0
     total_llm_calls: int = 0
-    start_time: float | None = None
-    end_time: float | None = None
+    start_time: int | None = None  # time.monotonic_ns()
+    end_time: int | None = None
 
-    # State change history (for debugging)
-    _state_history: list[tuple[float, LoopState]] = field(default_factory=list)
+    # State change history (for debugging, allocated on first record)
+    _state_history: deque[tuple[int, LoopState]] | None = None
 
     def is_running(self) -> bool:
         """Check if loop is running."""
-        return self.state not in (
-            LoopState.IDLE,
-            LoopState.COMPLETED,
-            LoopState.ERROR,
-        )
+        return not (1 << self.state.value) & _NOT_RUNNING_MASK
 
     def is_finished(self) -> bool:
         """Check if loop has finished."""
-        return self.state in (LoopState.COMPLETED, LoopState.ERROR)
+        return bool((1 << self.state.value) & _FINISHED_MASK)
 
     def duration_ms(self) -> float | None:
         """Execution time (milliseconds)."""
         if self.start_time is not None:
-            end = self.end_time or time.time()
-            return (end - self.start_time) * 1000
+            end = self.end_time or time.monotonic_ns()
+            return (end - self.start_time) / 1_000_000
         return None
 
     def record_state(self, state: LoopState) -> None:
         """Record state change (for history tracking)."""
-        self._state_history.append((time.time(), state))
         self.state = state
+        if _DEBUG_STATES:
+            history = self._state_history
+            if history is None:
+                history = self._state_history = deque(maxlen=STATE_HISTORY_LIMIT)
+            history.append((time.monotonic_ns(), state))
 
     def reset(self) -> None:
         """Reset context."""
@@ -94,13 +112,16 @@ class LoopContext:
         self.total_llm_calls = 0
         self.start_time = None
         self.end_time = None
-        self._state_history.clear()
+        self._state_history = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert context to dictionary (for serialization)."""
+        reason = self.termination_reason
         return {
-            "state": self.state.name,
-            "termination_reason": self.termination_reason.name if self.termination_reason else None,
+            "state": _STATE_NAMES[self.state.value],
+            "termination_reason": (
+                _TERM_NAMES[reason.value] if reason is not None else None
+            ),
             "current_turn": self.current_turn,
             "max_turns": self.max_turns,
             "total_tool_calls": self.total_tool_calls,
@@ -0,0 +1,211 @@
+"""Interactive agent command (with tools)."""
+
+import os
+from typing import TYPE_CHECKING, Callable
+
+import click
+from rich.panel import Panel
+
+from not_agent.cli.common import (
+    HISTORY_FILE,
+    _API_ERROR_MSG,
+    _RATE_LIMIT_MSG,
+    _RESET_TIP_MSG,
+    TodoSpinner,
+    _build_agent,
+    _history,
+    _md,
+    _write_captured,
+    check_api_key,
+    console,
+    show_context_status,
+    show_todo_panel,
+)
+
+if TYPE_CHECKING:
+    from not_agent.agent import AgentLoop
+
+
+# Welcome text. It depends only on (approval, debug) and the model name, so
+# all four variants are assembled once.
+_AGENT_WELCOME_HEAD = (
+    "[bold blue]Not Agent[/bold blue] - Agent Mode (with Tools)\n"
+    "Model: [cyan]{model}[/cyan]\n"
+    "Type [bold]exit[/bold] or [bold]quit[/bold] to end the session.\n"
+    "Type [bold]reset[/bold] to clear conversation history.\n"
+    "Type [bold]status[/bold] to show context usage.\n"
+    "Type [bold]compact[/bold] to manually compress context."
+)
+_AGENT_WELCOME_APPROVAL = {
+    True: "\n\n[green]✓ Approval mode enabled[/green]\n[dim]You will be asked before file modifications[/dim]",
+    False: "\n\n[yellow]⚠️  Approval mode disabled[/yellow]\n[dim]Files will be modified without confirmation (use --approval to enable)[/dim]",
+}
+_AGENT_WELCOME = {
+    (approval, debug): _AGENT_WELCOME_HEAD
+    + _AGENT_WELCOME_APPROVAL[approval]
+    + ("\n[cyan]🔍 Debug mode enabled[/cyan]" if debug else "")
+    for approval in (True, False)
+    for debug in (True, False)
+}
+
+
+# REPL commands. Handlers return True to end the session.
+def _cmd_exit(agent_loop: "AgentLoop") -> bool:
+    console.print("[dim]Goodbye![/dim]")
+    return True
+
+
+def _cmd_reset(agent_loop: "AgentLoop") -> bool:
+    agent_loop.reset()
+    console.print("[dim]Conversation history cleared.[/dim]")
+    return False
+
+
+def _cmd_status(agent_loop: "AgentLoop") -> bool:
+    show_context_status(agent_loop)
+    return False
+
+
+def _cmd_compact(agent_loop: "AgentLoop") -> bool:
+    # Force manual compaction
+    session, manager = agent_loop.session, agent_loop.context_manager
+    preserve = manager.preserve_recent_messages
+    if len(session) <= preserve + 2:
+        console.print("[yellow]Not enough messages to compact.[/yellow]")
+        console.print(f"[dim]Need at least {preserve + 3} messages.[/dim]")
+    else:
+        manager.compact(
+            session=session,
+            system_prompt=agent_loop.system_prompt,
+            debug_log=agent_loop._debug_log if agent_loop.debug else None,
+        )
+    return False
+
+
+_AGENT_COMMANDS: dict[str, Callable[["AgentLoop"], bool]] = {
+    "exit": _cmd_exit,
+    "quit": _cmd_exit,
+    "reset": _cmd_reset,
+    "status": _cmd_status,
+    "compact": _cmd_compact,
+}
+
+
+@click.command()
+@click.option(
+    "--model",
+    "-m",
+    default=None,
+    help="Model to use (e.g., claude-sonnet-4-20250514)",
+)
+@click.option(
+    "--approval/--no-approval",
+    default=True,
+    help="Require approval for file modifications (default: enabled)",
+)
+@click.option(
+    "--debug",
+    is_flag=True,
+    default=False,
+    help="Enable debug output (shows LLM requests, tool executions, etc.)",
+)
+@click.pass_context
+def agent(ctx: click.Context, model: str | None, approval: bool, debug: bool) -> None:
+    """Start an interactive agent session with tools."""
+    from anthropic import APIError, RateLimitError
+    from prompt_toolkit import PromptSession
+
+    from not_agent.core import EventBus, EventLogger
+
+    check_api_key()
+    config = ctx.obj["config"]
+
+    # Override Config with CLI options
+    if model:
+        config.set("model", model)
+    config.set("approval_enabled", approval)
+    config.set("debug", debug)
+
+    # Show welcome message
+    welcome_msg = _AGENT_WELCOME[approval, debug].format(
+        model=config.get("model", "default")
+    )
+    console.print(Panel(welcome_msg, title="Welcome"))
+
+    # Create event bus and logger (logging only in debug mode). Handlers run
+    # on the bus's own thread so logging does not hold up the loop.
+    event_bus = EventBus(background=True)
+    event_logger: EventLogger | None = None
+    if debug:
+        event_logger = EventLogger(console=console, verbose=True)
+        event_logger.attach(event_bus)
+
+    agent_loop, todo_manager, approval_manager = _build_agent(
+        config, approval, event_bus=event_bus
+    )
+
+    prompt_session: PromptSession[str] = PromptSession(
+        history=_history(os.path.abspath(HISTORY_FILE)),
+        multiline=False,
+    )
+
+    while True:
+        try:
+            user_input = prompt_session.prompt("\n> ").strip()
+
+            if not user_input:
+                continue
+
+            command = _AGENT_COMMANDS.get(user_input.lower())
+            if command is not None:
+                if command(agent_loop):
+                    break
+                continue
+
+            try:
+                # Create TodoSpinner that shows task list + spinner
+                spinner = TodoSpinner(console, todo_manager)
+                spinner.start()
+
+                # Set spinner callbacks on approval manager for user input prompts
+                if approval_manager:
+                    approval_manager.pause_spinner = spinner.pause
+                    approval_manager.resume_spinner = spinner.resume
+
+                try:
+                    # Pass callbacks to stop/start spinner during AskUserQuestion
+                    # Also pass update callback to refresh todo display
+                    # Rate-limited requests are retried inside the loop
+                    response = agent_loop.run(
+                        user_input,
+                        pause_spinner_callback=spinner.pause,
+                        resume_spinner_callback=spinner.resume,
+                        update_spinner_callback=spinner.update,
+                    )
+                finally:
+                    # Ensure spinner is stopped and debug logs are written
+                    spinner.stop()
+                    event_bus.flush()
+
+                # Render the response block, then write it in one go
+                with console.capture() as capture:
+                    console.print()
+                    console.print(_md(response))
+
+                    # Show todo panel if there are todos (final state)
+                    show_todo_panel(todo_manager)
+
+                    # Show context usage after each response
+                    show_context_status(agent_loop)
+                _write_captured(capture.get())
+
+            except RateLimitError:
+                console.print(_RATE_LIMIT_MSG)
+                console.print(_RESET_TIP_MSG)
+            except APIError as e:
+                console.print(_API_ERROR_MSG.format(error=e))
+
+        except KeyboardInterrupt:
+            console.print("\n[dim]Use 'exit' to quit[/dim]")
+        except EOFError:
+            break
@@ -0,0 +1,37 @@
+"""One-shot question command."""
+
+from functools import partial
+
+import click
+
+from not_agent.cli.common import (
+    _call_with_backoff,
+    _stream_live,
+    _stream_markdown,
+    _with_api_errors,
+    check_api_key,
+)
+
+
+@click.command()
+@click.argument("message")
+@click.pass_context
+@_with_api_errors
+def ask(ctx: click.Context, message: str) -> None:
+    """Ask a single question and get a response."""
+    from not_agent.provider import get_provider, limiter_from_config
+
+    check_api_key()
+    config = ctx.obj["config"]
+
+    provider = get_provider(config.get("provider", "claude"), config)
+
+    with _stream_live() as live:
+        _call_with_backoff(
+            _stream_markdown,
+            partial(provider.stream_simple_chat, message),
+            live,
+            spinner=live,
+            limiter=limiter_from_config(config),
+            tokens=len(message) // 4,
+        )
@@ -0,0 +1,86 @@
+"""Concurrent batch question command."""
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+import click
+from rich.panel import Panel
+
+from not_agent.cli.common import _md, _status, check_api_key, console
+
+if TYPE_CHECKING:
+    from not_agent.provider import SlidingWindowLimiter
+
+
+async def _run_batch(
+    provider: Any,
+    prompts: list[str],
+    limiter: "SlidingWindowLimiter",
+    concurrency: int,
+) -> list[str | BaseException]:
+    """Send prompts concurrently, bounded by a semaphore and the limiter."""
+    import asyncio
+
+    from anthropic import RateLimitError
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(prompt: str) -> str:
+        async with sem:
+            await limiter.acquire_async(len(prompt) // 4)
+            try:
+                return await provider.simple_chat_async(prompt)  # type: ignore[no-any-return]
+            except RateLimitError:
+                limiter.on_rate_limited()
+                raise
+
+    try:
+        return await asyncio.gather(
+            *(one(prompt) for prompt in prompts), return_exceptions=True
+        )
+    finally:
+        await provider.aclose()
+
+
+@click.command()
+@click.argument("file", type=click.File("r"))
+@click.option(
+    "--concurrency",
+    "-c",
+    default=5,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Maximum number of requests in flight",
+)
+@click.pass_context
+def batch(ctx: click.Context, file: Any, concurrency: int) -> None:
+    """Ask each line of FILE as a separate question, concurrently."""
+    import asyncio
+
+    from not_agent.provider import get_provider, limiter_from_config
+
+    check_api_key()
+    config = ctx.obj["config"]
+
+    prompts = [line.strip() for line in file if line.strip()]
+    if not prompts:
+        console.print("[yellow]No prompts found.[/yellow]")
+        return
+
+    provider = get_provider(config.get("provider", "claude"), config)
+    with _status(f"[bold green]Running {len(prompts)} prompts...[/bold green]"):
+        results = asyncio.run(
+            _run_batch(provider, prompts, limiter_from_config(config), concurrency)
+        )
+
+    failed = 0
+    for i, (prompt, result) in enumerate(zip(prompts, results), 1):
+        console.print(Panel(prompt, title=f"#{i}", border_style="blue"))
+        if isinstance(result, BaseException):
+            failed += 1
+            console.print(f"[red bold]⚠️  Error:[/red bold] [yellow]{result}[/yellow]")
+        else:
+            console.print(_md(result))
+
+    if failed:
+        sys.exit(1)
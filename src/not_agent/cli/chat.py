@@ -0,0 +1,85 @@
+"""Interactive chat command (simple mode, no tools)."""
+
+import os
+from functools import partial
+
+import click
+from rich.panel import Panel
+
+from not_agent.cli.common import (
+    HISTORY_FILE,
+    _API_ERROR_MSG,
+    _EXIT_COMMANDS,
+    _RATE_LIMIT_MSG,
+    _call_with_backoff,
+    _history,
+    _stream_live,
+    _stream_markdown,
+    check_api_key,
+    console,
+)
+
+_CHAT_WELCOME = Panel(
+    "[bold blue]Not Agent[/bold blue] - Simple Chat Mode\n"
+    "Type [bold]exit[/bold] or [bold]quit[/bold] to end the session.",
+    title="Welcome",
+)
+
+
+@click.command()
+@click.pass_context
+def chat(ctx: click.Context) -> None:
+    """Start an interactive chat session (simple mode, no tools)."""
+    from anthropic import APIError, RateLimitError
+    from prompt_toolkit import PromptSession
+
+    from not_agent.provider import get_provider, limiter_from_config
+
+    check_api_key()
+    config = ctx.obj["config"]
+
+    console.print(_CHAT_WELCOME)
+
+    # Simple chat using provider (created on first message)
+    provider = None
+    limiter = limiter_from_config(config)
+    prompt_session: PromptSession[str] = PromptSession(
+        history=_history(os.path.abspath(HISTORY_FILE)),
+        multiline=False,
+    )
+
+    while True:
+        try:
+            user_input = prompt_session.prompt("\n> ").strip()
+
+            if not user_input:
+                continue
+
+            if user_input.lower() in _EXIT_COMMANDS:
+                console.print("[dim]Goodbye![/dim]")
+                break
+
+            try:
+                provider = provider or get_provider(
+                    config.get("provider", "claude"), config
+                )
+                console.print()
+                with _stream_live() as live:
+                    _call_with_backoff(
+                        _stream_markdown,
+                        partial(provider.stream_simple_chat, user_input),
+                        live,
+                        spinner=live,
+                        limiter=limiter,
+                        tokens=len(user_input) // 4,
+                    )
+
+            except RateLimitError:
+                console.print(_RATE_LIMIT_MSG)
+            except APIError as e:
+                console.print(_API_ERROR_MSG.format(error=e))
+
+        except KeyboardInterrupt:
+            console.print("\n[dim]Use 'exit' to quit[/dim]")
+        except EOFError:
+            break
@@ -0,0 +1,509 @@
+"""Console, rendering and API helpers shared by the CLI commands."""
+
+import os
+import sys
+import time
+from bisect import bisect_right
+from contextlib import nullcontext
+from functools import cache, lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+from weakref import WeakKeyDictionary
+
+from rich.console import Console, Group, RenderableType
+from rich.panel import Panel
+from rich.spinner import Spinner
+from rich.live import Live
+from rich.text import Text
+
+# anthropic and rich.markdown are imported where used so that modules which
+# only need the console stay cheap to import.
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+    from not_agent.cli.history import BoundedFileHistory
+
+    from not_agent.agent import AgentLoop
+    from not_agent.agent.approval import ApprovalManager
+    from not_agent.config import Config
+    from not_agent.core import EventBus
+    from not_agent.provider import SlidingWindowLimiter
+    from not_agent.tools import TodoManager
+
+
+console = Console()
+
+# Live display frame rates. Each refresh rewrites the whole region, so keep
+# these low; the spinner and streamed text still read as smooth.
+_SPINNER_REFRESH_PER_SECOND = 4
+_STREAM_REFRESH_PER_SECOND = 8
+
+
+# Todo status icons for the spinner and the final todo panel
+_SPINNER_ICONS = {"completed": "✅", "in_progress": "🔄", "pending": "⬜"}
+_PANEL_ICONS = {
+    "completed": "[green]✅[/green]",
+    "in_progress": "[yellow]🔄[/yellow]",
+    "pending": "[dim]⬜[/dim]",
+}
+
+# (status, content) of each todo, used to detect an unchanged todo list
+_TodoKey = tuple[tuple[str | None, str | None], ...]
+
+
+# Longest current task name shown on the spinner line
+_TASK_MAX_LEN = 50
+
+
+@lru_cache(maxsize=64)
+def _spinner_text(current_task: str | None, completed: int, total: int) -> str:
+    """Format the spinner line for the current task and progress."""
+    if not current_task:
+        return "[bold green]Thinking...[/bold green]"
+
+    # Truncate long task names
+    if len(current_task) > _TASK_MAX_LEN:
+        current_task = current_task[: _TASK_MAX_LEN - 3] + "..."
+    return (
+        f"[bold green]Thinking...[/bold green] [dim]|[/dim] "
+        f"[yellow]🔄 {current_task}[/yellow] [dim]({completed}/{total})[/dim]"
+    )
+
+
+class TodoSpinner:
+    """Spinner that shows todo list and current task using Rich Live display."""
+
+    def __init__(self, console: Console, todo_manager: "TodoManager"):
+        self.console = console
+        self.todo_manager = todo_manager
+        self._live: Live | None = None
+        # Outstanding pause() calls; the display restarts when this hits 0
+        self._pause_depth = 0
+        # Last built display and the (todos, current task) it was built from
+        self._cache_key: tuple[_TodoKey, str | None] | None = None
+        self._cached_group: Group | None = None
+
+    def _build_display(self) -> Group:
+        """Build the complete display with todo list and spinner.
+
+        The previous Group is returned while the todos and current task are
+        unchanged; the Spinner inside it keeps animating on each refresh.
+        """
+        todos = self.todo_manager.get_todos()
+        current_task = self.todo_manager.get_current_task()
+        key = (
+            tuple((t.get("status"), t.get("content")) for t in todos),
+            current_task,
+        )
+        if key == self._cache_key and self._cached_group is not None:
+            return self._cached_group
+
+        summary = self.todo_manager.get_summary()
+        parts: list[RenderableType] = []
+
+        # Todo list
+        if todos:
+            # Header
+            parts.append(Text(f"📋 Tasks ({summary['completed']}/{summary['total']})"))
+
+            # Todo items
+            for todo in todos:
+                status = todo.get("status", "pending")
+                icon = _SPINNER_ICONS.get(status, "⬜")
+                content = todo.get("content", "")
+
+                if status == "completed":
+                    parts.append(Text(f"  {icon} {content}", style="strike"))
+                elif status == "in_progress":
+                    parts.append(Text(f"  {icon} {content}", style="bold"))
+                else:
+                    parts.append(Text(f"  {icon} {content}"))
+
+            # Spacing
+            parts.append(Text(""))
+
+        # Spinner line with actual Spinner object
+        spinner_text = _spinner_text(
+            current_task, summary["completed"], summary["total"]
+        )
+        parts.append(Spinner("dots", text=spinner_text, style="green"))
+
+        self._cache_key = key
+        self._cached_group = Group(*parts)
+        return self._cached_group
+
+    def start(self) -> None:
+        """Start the live display (no-op when output is not a terminal)."""
+        if not self.console.is_terminal:
+            return
+        if self._live is None:
+            self._live = Live(
+                self._build_display(),
+                console=self.console,
+                refresh_per_second=_SPINNER_REFRESH_PER_SECOND,
+                auto_refresh=True,
+                transient=True,  # Remove when stopped
+            )
+            self._live.start()
+        else:
+            self._live.start()
+
+    def stop(self) -> None:
+        """Stop the live display."""
+        if self._live:
+            self._live.stop()
+
+    def pause(self) -> None:
+        """Stop the display; nested pauses only stop it once."""
+        self._pause_depth += 1
+        if self._pause_depth == 1:
+            self.stop()
+
+    def resume(self) -> None:
+        """Undo one pause(); restart the display when none remain."""
+        if self._pause_depth == 0:
+            return
+        self._pause_depth -= 1
+        if self._pause_depth == 0:
+            self.start()
+
+    def update(self) -> None:
+        """Update the live display with current todo state."""
+        if self._live and not self._pause_depth:
+            previous = self._cached_group
+            display = self._build_display()
+            if display is not previous:
+                self._live.update(display)
+
+
+# (status, content) pairs last shown by show_todo_panel, per todo manager
+_LAST_TODO_PANEL: "WeakKeyDictionary[TodoManager, _TodoKey]" = WeakKeyDictionary()
+
+
+def show_todo_panel(todo_manager: "TodoManager") -> None:
+    """Show the current todo list as a panel, unless it is unchanged."""
+    todos = todo_manager.get_todos()
+    if not todos:
+        return  # Don't show if no todos
+
+    key = tuple((t.get("status"), t.get("content")) for t in todos)
+    if _LAST_TODO_PANEL.get(todo_manager) == key:
+        return  # Already shown after an earlier response
+    _LAST_TODO_PANEL[todo_manager] = key
+
+    summary = todo_manager.get_summary()
+
+    # Format todo items
+    lines = []
+    for todo in todos:
+        status = todo.get("status", "pending")
+        icon = _PANEL_ICONS.get(status, "⬜")
+        content = todo.get("content", "")
+
+        # Apply text style based on status
+        if status == "completed":
+            lines.append(f"{icon} [dim strikethrough]{content}[/dim strikethrough]")
+        elif status == "in_progress":
+            lines.append(f"{icon} [bold]{content}[/bold]")
+        else:
+            lines.append(f"{icon} {content}")
+
+    # Panel title
+    title = f"📋 Tasks ({summary['completed']}/{summary['total']} completed)"
+
+    console.print(
+        Panel(
+            "\n".join(lines),
+            title=title,
+            border_style="blue",
+        )
+    )
+
+
+# Responses longer than this are rendered without caching
+_MD_CACHE_MAX_LEN = 16_384
+
+
+@lru_cache(maxsize=32)
+def _md_cached(text: str) -> "Markdown":
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+def _md(text: str) -> "Markdown":
+    """Return a Markdown renderable, reusing parses of repeated responses."""
+    if len(text) < _MD_CACHE_MAX_LEN:
+        return _md_cached(text)
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+# Shown in the streaming Live view until the first text arrives
+_THINKING = Spinner("dots", text="[bold green]Thinking...[/bold green]", style="green")
+
+
+def _status(message: str) -> Any:
+    """console.status() on a terminal, a no-op context manager otherwise."""
+    if console.is_terminal:
+        return console.status(message, refresh_per_second=_SPINNER_REFRESH_PER_SECOND)
+    return nullcontext()
+
+
+def _stream_live() -> Live:
+    """Live view for streamed responses; no refresh thread when piped."""
+    return Live(
+        _THINKING,
+        console=console,
+        refresh_per_second=_STREAM_REFRESH_PER_SECOND,
+        auto_refresh=console.is_terminal,
+    )
+
+
+def _write_captured(text: str) -> None:
+    """Write output captured from console with a single write and flush."""
+    console.file.write(text)
+    console.file.flush()
+
+
+# Longest a streamed paragraph goes without a re-render (seconds)
+_STREAM_MAX_RENDER_DELAY = 0.5
+
+
+class StreamingMarkdown:
+    """Accumulate streamed text and re-render it as Markdown in blocks.
+
+    Re-parsing the whole buffer on every delta is quadratic over a
+    response, so the view is only refreshed when a paragraph break or code
+    fence arrives, or when a long paragraph has gone _STREAM_MAX_RENDER_DELAY
+    without one. finish() renders the complete text once.
+    """
+
+    def __init__(self, update: Callable[[Any], None], incremental: bool = True) -> None:
+        self._update = update
+        self._incremental = incremental
+        self._chunks: list[str] = []
+        # Last two characters fed, to spot boundaries split across deltas
+        self._tail = ""
+        self._rendered_at = time.monotonic()
+
+    def feed(self, delta: str) -> None:
+        """Add a text delta, re-rendering if it completes a block."""
+        self._chunks.append(delta)
+        if not self._incremental:
+            return
+        # Only boundaries that end inside this delta count; one lying
+        # wholly in the carried-over tail was handled last time
+        tail_len = len(self._tail)
+        window = self._tail + delta
+        self._tail = window[-2:]
+        now = time.monotonic()
+        if (
+            window.find("\n\n", max(0, tail_len - 1)) != -1
+            or window.find("```", max(0, tail_len - 2)) != -1
+            or now - self._rendered_at >= _STREAM_MAX_RENDER_DELAY
+        ):
+            from rich.markdown import Markdown
+
+            self._update(Markdown("".join(self._chunks)))
+            self._rendered_at = now
+
+    def finish(self) -> str:
+        """Render the complete text and return it."""
+        text = "".join(self._chunks)
+        self._update(_md(text))
+        return text
+
+
+def _stream_markdown(chunks: Callable[[], Iterator[str]], live: Live) -> str:
+    """Render streamed text into a Live view and return the full text.
+
+    When output is not a terminal only the final render is shown, so the
+    intermediate parses are skipped.
+    """
+    view = StreamingMarkdown(live.update, incremental=console.is_terminal)
+    for delta in chunks():
+        view.feed(delta)
+    return view.finish()
+
+
+# Text progress bars for show_context_status, indexed by filled cells
+_CONTEXT_BAR_WIDTH = 30
+_CONTEXT_BARS = tuple(
+    "█" * filled + "░" * (_CONTEXT_BAR_WIDTH - filled)
+    for filled in range(_CONTEXT_BAR_WIDTH + 1)
+)
+
+
+# Status line templates per usage level, selected by bisecting the thresholds
+_CONTEXT_THRESHOLDS = (50, 75)
+_CONTEXT_TEMPLATES = tuple(
+    f"\n[dim]Context: [{color}]{{bar}}[/{color}] "
+    f"{{pct:.1f}}% ({{cur:,}}/{{mx:,}} tokens, {{msgs}} msgs) {status}[/dim]"
+    for color, status in (
+        ("green", "✓ Good"),
+        ("yellow", "⚡ Medium"),
+        ("red", "⚠️  High"),
+    )
+)
+
+
+def show_context_status(agent_loop: "AgentLoop") -> None:
+    """Show context usage status with a progress bar (terminal only)."""
+    if not console.is_terminal:
+        return
+    usage = agent_loop.get_context_usage()
+    percentage = usage["percentage"]
+
+    # Choose template based on usage
+    template = _CONTEXT_TEMPLATES[bisect_right(_CONTEXT_THRESHOLDS, percentage)]
+
+    # Cap at 100% for visual representation
+    display_percentage = min(percentage, 100)
+    bar = _CONTEXT_BARS[int(_CONTEXT_BAR_WIDTH * display_percentage / 100)]
+
+    console.print(
+        template.format(
+            bar=bar,
+            pct=percentage,
+            cur=usage["current"],
+            mx=usage["max"],
+            msgs=usage["messages"],
+        )
+    )
+
+
+def _build_agent(
+    config: "Config",
+    approval: bool,
+    event_bus: "EventBus | None" = None,
+) -> tuple["AgentLoop", "TodoManager", "ApprovalManager | None"]:
+    """Build an agent loop with all tools for the agent and run commands.
+
+    Returns:
+        The agent loop, its per-session TodoManager, and the approval
+        manager (None when approval is disabled)
+    """
+    from not_agent.agent import AgentLoop
+    from not_agent.agent.approval import ApprovalManager
+    from not_agent.agent.executor import ToolExecutor
+    from not_agent.tools import TodoManager, get_all_tools
+
+    # Create TodoManager (per-session instance)
+    todo_manager = TodoManager()
+
+    # Create approval manager if enabled
+    approval_manager = ApprovalManager(enabled=approval) if approval else None
+
+    # Create executor with approval plugin and TodoManager
+    tools = get_all_tools(todo_manager=todo_manager)
+    executor = ToolExecutor(tools=tools, approval_manager=approval_manager)
+
+    agent_loop = AgentLoop(
+        config=config,
+        event_bus=event_bus,
+        executor=executor,
+        todo_manager=todo_manager,
+    )
+    return agent_loop, todo_manager, approval_manager
+
+
+# Set once the API key has been found; the environment does not change
+# within a session
+_API_KEY_OK = False
+
+
+def check_api_key() -> None:
+    """Check if API key is set."""
+    global _API_KEY_OK
+    if _API_KEY_OK:
+        return
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        console.print(
+            "[red]Error:[/red] ANTHROPIC_API_KEY environment variable is not set.\n"
+            "Set it with:\n"
+            "  [bold]export ANTHROPIC_API_KEY='your-api-key'[/bold]"
+        )
+        sys.exit(1)
+    _API_KEY_OK = True
+
+
+_T = TypeVar("_T")
+
+
+def _call_with_backoff(
+    fn: Callable[..., _T],
+    *args: Any,
+    spinner: Any = None,
+    limiter: "SlidingWindowLimiter | None" = None,
+    tokens: int = 0,
+    **kwargs: Any,
+) -> _T:
+    """Call fn with not_agent.provider.call_with_backoff, reporting retries.
+
+    Only wrap a single API request with this. The spinner (any object with
+    stop()/start()) is paused while waiting.
+    """
+    from not_agent.provider.ratelimit import BACKOFF_ATTEMPTS, call_with_backoff
+
+    def wait(delay: float, attempt: int) -> None:
+        if spinner is not None:
+            spinner.stop()
+        console.print(
+            f"[yellow]Rate limited, retrying in {delay:.1f}s "
+            f"({attempt + 1}/{BACKOFF_ATTEMPTS - 1})...[/yellow]"
+        )
+        time.sleep(delay)
+        if spinner is not None:
+            spinner.start()
+
+    return call_with_backoff(
+        fn, *args, limiter=limiter, tokens=tokens, wait=wait, **kwargs
+    )
+
+
+# API error messages shared by all commands
+_RATE_LIMIT_MSG = (
+    "\n[red bold]⚠️  Rate Limit Exceeded[/red bold]\n"
+    "[yellow]Please wait a moment before trying again.[/yellow]"
+)
+_RESET_TIP_MSG = "[dim]Tip: You can use 'reset' to reduce context size.[/dim]"
+_API_ERROR_MSG = (
+    "\n[red bold]⚠️  API Error[/red bold]\n"
+    "[yellow]{error}[/yellow]\n"
+    "[dim]Please check your connection and API key.[/dim]"
+)
+
+
+def _with_api_errors(fn: Callable[..., _T]) -> Callable[..., _T | None]:
+    """Report rate-limit/API errors from a one-shot command and exit 1."""
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> _T | None:
+        from anthropic import APIError, RateLimitError
+
+        try:
+            return fn(*args, **kwargs)
+        except RateLimitError:
+            console.print(_RATE_LIMIT_MSG)
+        except APIError as e:
+            console.print(_API_ERROR_MSG.format(error=e))
+        sys.exit(1)
+
+    return wrapper
+
+
+# Prompt history file, relative to the working directory
+HISTORY_FILE = ".not_agent_history"
+
+
+@cache
+def _history(path: str) -> "BoundedFileHistory":
+    """Return the prompt history for an absolute path, loaded once per process."""
+    from not_agent.cli.history import BoundedFileHistory
+
+    return BoundedFileHistory(path)
+
+
+# Inputs that end a REPL session
+_EXIT_COMMANDS = frozenset({"exit", "quit"})
@@ -0,0 +1,57 @@
+"""Prompt history storage."""
+
+import os
+from collections import deque
+from typing import Iterable
+
+from prompt_toolkit.history import FileHistory
+
+# Default number of prompt entries kept in the history file
+MAX_HISTORY_ENTRIES = 5000
+
+
+class BoundedFileHistory(FileHistory):
+    """FileHistory that keeps only the most recent entries.
+
+    Loading keeps at most max_entries in memory. If the file holds more,
+    it is rewritten with just those, so later startups stay O(max_entries).
+    """
+
+    def __init__(self, filename: str, max_entries: int = MAX_HISTORY_ENTRIES) -> None:
+        self.max_entries = max_entries
+        super().__init__(filename)
+
+    def load_history_strings(self) -> Iterable[str]:
+        # (raw file block, decoded entry) for the newest entries
+        entries: deque[tuple[bytes, str]] = deque(maxlen=self.max_entries)
+        total = 0
+
+        if os.path.exists(self.filename):
+            with open(self.filename, "rb") as f:
+                block: list[bytes] = []
+                lines: list[bytes] = []
+                for raw in f:
+                    if raw.startswith(b"+"):
+                        lines.append(raw[1:])
+                        block.append(raw)
+                        continue
+                    if lines:
+                        text = b"".join(lines)[:-1].decode("utf-8", errors="replace")
+                        entries.append((b"".join(block), text))
+                        total += 1
+                        block, lines = [], []
+                    block.append(raw)
+                if lines:
+                    text = b"".join(lines)[:-1].decode("utf-8", errors="replace")
+                    entries.append((b"".join(block), text))
+                    total += 1
+
+            if total > self.max_entries:
+                try:
+                    with open(self.filename, "wb") as f:
+                        f.writelines(raw for raw, _ in entries)
+                except OSError:
+                    pass  # Keep the oversized file; history still loads
+
+        # Newest items first
+        return [text for _, text in reversed(entries)]
@@ -1,203 +1,88 @@
 """CLI entry point."""
 
-import os
-import sys
-from typing import TYPE_CHECKING
+import importlib
 
 from dotenv import load_dotenv
 import click
 
 # Load environment variables from .env file (auto-searches from project root)
 load_dotenv()
-from rich.console import Console, Group
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.spinner import Spinner
-from rich.live import Live
-from rich.text import Text
-from prompt_toolkit import prompt
-from prompt_toolkit.history import FileHistory
-
-from anthropic import RateLimitError, APIError
 
 from not_agent.config import Config
-from not_agent.provider import get_provider
-from not_agent.agent import AgentLoop
-from not_agent.agent.approval import ApprovalManager
-from not_agent.agent.executor import ToolExecutor
-from not_agent.tools import TodoManager, get_all_tools
-from not_agent.core import EventBus, EventLogger
-
-
-console = Console()
-
-
-class TodoSpinner:
-    """Spinner that shows todo list and current task using Rich Live display."""
-
-    def __init__(self, console: Console, todo_manager: TodoManager):
-        self.console = console
-        self.todo_manager = todo_manager
-        self._live: Live | None = None
-
-    def _build_display(self) -> Group:
-        """Build the complete display with todo list and spinner."""
-        parts = []
-
-        # Todo list
-        todos = self.todo_manager.get_todos()
-        if todos:
-            status_icons = {"completed": "✅", "in_progress": "🔄", "pending": "⬜"}
-            summary = self.todo_manager.get_summary()
-
-            # Header
-            parts.append(Text(f"📋 Tasks ({summary['completed']}/{summary['total']})"))
-
-            # Todo items
-            for todo in todos:
-                status = todo.get("status", "pending")
-                icon = status_icons.get(status, "⬜")
-                content = todo.get("content", "")
-
-                if status == "completed":
-                    parts.append(Text(f"  {icon} {content}", style="strike"))
-                elif status == "in_progress":
-                    parts.append(Text(f"  {icon} {content}", style="bold"))
-                else:
-                    parts.append(Text(f"  {icon} {content}"))
-
-            # Spacing
-            parts.append(Text(""))
-
-        # Spinner line with actual Spinner object
-        current_task = self.todo_manager.get_current_task()
 
-        if current_task:
-            summary = self.todo_manager.get_summary()
-            progress = f"({summary['completed']}/{summary['total']})"
 
-            # Truncate long task names
-            max_len = 50
-            if len(current_task) > max_len:
-                current_task = current_task[:max_len-3] + "..."
-
-            spinner_text = f"[bold green]Thinking...[/bold green] [dim]|[/dim] [yellow]🔄 {current_task}[/yellow] [dim]{progress}[/dim]"
-        else:
-            spinner_text = "[bold green]Thinking...[/bold green]"
-
-        # Use Spinner directly as renderable
-        parts.append(Spinner("dots", text=spinner_text, style="green"))
-
-        return Group(*parts)
-
-    def start(self) -> None:
-        """Start the live display."""
-        if self._live is None:
-            self._live = Live(
-                self._build_display(),
-                console=self.console,
-                refresh_per_second=10,
-                transient=True,  # Remove when stopped
-            )
-            self._live.start()
-        else:
-            self._live.start()
-
-    def stop(self) -> None:
-        """Stop the live display."""
-        if self._live:
-            self._live.stop()
-
-    def update(self) -> None:
-        """Update the live display with current todo state."""
-        if self._live:
-            self._live.update(self._build_display())
-
-
-def show_todo_panel(todo_manager: TodoManager) -> None:
-    """Show the current todo list as a panel."""
-    todos = todo_manager.get_todos()
-    if not todos:
-        return  # Don't show if no todos
-
-    summary = todo_manager.get_summary()
-
-    # Status icons
-    status_icons = {
-        "completed": "[green]✅[/green]",
-        "in_progress": "[yellow]🔄[/yellow]",
-        "pending": "[dim]⬜[/dim]",
+class LazyGroup(click.Group):
+    """Group that imports a subcommand's module only when it is dispatched.
+
+    Each command lives in its own module, so running one command never
+    loads the others, and the group's --help is rendered from a static
+    table so it imports none of them (and so not rich either). Heavy
+    dependencies (anthropic, prompt_toolkit, agent/tools) stay inside the
+    command functions so a command's own --help is cheap as well.
+    """
+
+    # Command name -> (module path, attribute, short help). The short help
+    # mirrors the first line of each command's docstring.
+    lazy_subcommands: dict[str, tuple[str, str, str]] = {
+        "agent": (
+            "not_agent.cli.agent",
+            "agent",
+            "Start an interactive agent session with tools.",
+        ),
+        "ask": (
+            "not_agent.cli.ask",
+            "ask",
+            "Ask a single question and get a response.",
+        ),
+        "batch": (
+            "not_agent.cli.batch",
+            "batch",
+            "Ask each line of FILE as a separate question, concurrently.",
+        ),
+        "chat": (
+            "not_agent.cli.chat",
+            "chat",
+            "Start an interactive chat session (simple mode, no tools).",
+        ),
+        "run": (
+            "not_agent.cli.run",
+            "run",
+            "Run agent with a single task (with tools).",
+        ),
     }
 
-    # Format todo items
-    lines = []
-    for todo in todos:
-        status = todo.get("status", "pending")
-        icon = status_icons.get(status, "⬜")
-        content = todo.get("content", "")
-
-        # Apply text style based on status
-        if status == "completed":
-            lines.append(f"{icon} [dim strikethrough]{content}[/dim strikethrough]")
-        elif status == "in_progress":
-            lines.append(f"{icon} [bold]{content}[/bold]")
-        else:
-            lines.append(f"{icon} {content}")
-
-    # Panel title
-    title = f"📋 Tasks ({summary['completed']}/{summary['total']} completed)"
-
-    console.print(Panel(
-        "\n".join(lines),
-        title=title,
-        border_style="blue",
-    ))
-
-
-def show_context_status(agent_loop: 'AgentLoop') -> None:
-    """Show context usage status with a progress bar."""
-    usage = agent_loop.get_context_usage()
-    percentage = usage['percentage']
-    current = usage['current']
-    max_tokens = usage['max']
-    messages = usage['messages']
-
-    # Choose color based on usage
-    if percentage >= 75:
-        color = "red"
-        status = "⚠️  High"
-    elif percentage >= 50:
-        color = "yellow"
-        status = "⚡ Medium"
-    else:
-        color = "green"
-        status = "✓ Good"
-
-    # Create a simple text-based progress bar
-    bar_width = 30
-    # Cap at 100% for visual representation
-    display_percentage = min(percentage, 100)
-    filled = int(bar_width * display_percentage / 100)
-    bar = "█" * filled + "░" * (bar_width - filled)
-
-    console.print(
-        f"\n[dim]Context: [{color}]{bar}[/{color}] "
-        f"{percentage:.1f}% ({current:,}/{max_tokens:,} tokens, {messages} msgs) {status}[/dim]"
-    )
-
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        target = self.lazy_subcommands.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+        module_path, attr, _ = target
+        command: click.Command = getattr(importlib.import_module(module_path), attr)
+        return command
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """List commands using the static short help for lazy ones."""
+        rows = []
+        for name in self.list_commands(ctx):
+            target = self.lazy_subcommands.get(name)
+            if target is not None:
+                rows.append((name, target[2]))
+                continue
+            command = super().get_command(ctx, name)
+            if command is not None and not command.hidden:
+                limit = formatter.width - 6 - len(name)
+                rows.append((name, command.get_short_help_str(limit)))
 
-def check_api_key() -> None:
-    """Check if API key is set."""
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        console.print(
-            "[red]Error:[/red] ANTHROPIC_API_KEY environment variable is not set.\n"
-            "Set it with:\n"
-            "  [bold]export ANTHROPIC_API_KEY='your-api-key'[/bold]"
-        )
-        sys.exit(1)
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.version_option()
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -207,338 +92,5 @@ def cli(ctx: click.Context) -> None:
     ctx.obj["config"] = Config()
 
 
-@cli.command()
-@click.pass_context
-def chat(ctx: click.Context) -> None:
-    """Start an interactive chat session (simple mode, no tools)."""
-    check_api_key()
-    config = ctx.obj["config"]
-
-    console.print(
-        Panel(
-            "[bold blue]Not Agent[/bold blue] - Simple Chat Mode\n"
-            "Type [bold]exit[/bold] or [bold]quit[/bold] to end the session.",
-            title="Welcome",
-        )
-    )
-
-    # Simple chat using provider
-    provider = get_provider(config.get("provider", "claude"), config)
-    history = FileHistory(".not_agent_history")
-
-    while True:
-        try:
-            user_input = prompt(
-                "\n> ",
-                history=history,
-                multiline=False,
-            ).strip()
-
-            if not user_input:
-                continue
-
-            if user_input.lower() in ("exit", "quit"):
-                console.print("[dim]Goodbye![/dim]")
-                break
-
-            try:
-                with console.status("[bold green]Thinking...[/bold green]"):
-                    response = provider.simple_chat(user_input)
-
-                console.print()
-                console.print(Markdown(response))
-
-            except RateLimitError:
-                console.print("\n[red bold]⚠️  Rate Limit Exceeded[/red bold]")
-                console.print("[yellow]Please wait a moment before trying again.[/yellow]")
-            except APIError as e:
-                console.print("\n[red bold]⚠️  API Error[/red bold]")
-                console.print(f"[yellow]{str(e)}[/yellow]")
-                console.print("[dim]Please check your connection and API key.[/dim]")
-
-        except KeyboardInterrupt:
-            console.print("\n[dim]Use 'exit' to quit[/dim]")
-        except EOFError:
-            break
-
-
-@cli.command()
-@click.option(
-    "--model", "-m",
-    default=None,
-    help="Model to use (e.g., claude-sonnet-4-20250514)",
-)
-@click.option(
-    "--approval/--no-approval",
-    default=True,
-    help="Require approval for file modifications (default: enabled)",
-)
-@click.option(
-    "--debug",
-    is_flag=True,
-    default=False,
-    help="Enable debug output (shows LLM requests, tool executions, etc.)",
-)
-@click.pass_context
-def agent(ctx: click.Context, model: str | None, approval: bool, debug: bool) -> None:
-    """Start an interactive agent session with tools."""
-    check_api_key()
-    config = ctx.obj["config"]
-
-    # Override Config with CLI options
-    if model:
-        config.set("model", model)
-    config.set("approval_enabled", approval)
-    config.set("debug", debug)
-
-    # Create TodoManager (per-session instance)
-    todo_manager = TodoManager()
-
-    # Create event bus and logger (logging only in debug mode)
-    event_bus = EventBus()
-    event_logger: EventLogger | None = None
-    if debug:
-        event_logger = EventLogger(console=console, verbose=True)
-        event_logger.attach(event_bus)
-
-    # Create approval manager if enabled
-    approval_manager = ApprovalManager(enabled=approval) if approval else None
-
-    # Create executor with approval plugin and TodoManager
-    tools = get_all_tools(todo_manager=todo_manager)
-    executor = ToolExecutor(tools=tools, approval_manager=approval_manager)
-
-    # Create agent loop with config, executor, and event bus
-    agent_loop = AgentLoop(
-        config=config,
-        event_bus=event_bus,
-        executor=executor,
-        todo_manager=todo_manager,
-    )
-
-    # Show welcome message
-    model_name = config.get("model", "default")
-    welcome_msg = (
-        f"[bold blue]Not Agent[/bold blue] - Agent Mode (with Tools)\n"
-        f"Model: [cyan]{model_name}[/cyan]\n"
-        "Type [bold]exit[/bold] or [bold]quit[/bold] to end the session.\n"
-        "Type [bold]reset[/bold] to clear conversation history.\n"
-        "Type [bold]status[/bold] to show context usage.\n"
-        "Type [bold]compact[/bold] to manually compress context."
-    )
-
-    if approval:
-        welcome_msg += "\n\n[green]✓ Approval mode enabled[/green]\n[dim]You will be asked before file modifications[/dim]"
-    else:
-        welcome_msg += "\n\n[yellow]⚠️  Approval mode disabled[/yellow]\n[dim]Files will be modified without confirmation (use --approval to enable)[/dim]"
-
-    if debug:
-        welcome_msg += "\n[cyan]🔍 Debug mode enabled[/cyan]"
-
-    console.print(Panel(welcome_msg, title="Welcome"))
-
-    history = FileHistory(".not_agent_history")
-
-    while True:
-        try:
-            user_input = prompt(
-                "\n> ",
-                history=history,
-                multiline=False,
-            ).strip()
-
-            if not user_input:
-                continue
-
-            if user_input.lower() in ("exit", "quit"):
-                console.print("[dim]Goodbye![/dim]")
-                break
-
-            if user_input.lower() == "reset":
-                agent_loop.reset()
-                console.print("[dim]Conversation history cleared.[/dim]")
-                continue
-
-            if user_input.lower() == "status":
-                show_context_status(agent_loop)
-                continue
-
-            if user_input.lower() == "compact":
-                # Force manual compaction
-                if len(agent_loop.messages) <= agent_loop.preserve_recent_messages + 2:
-                    console.print("[yellow]Not enough messages to compact.[/yellow]")
-                    console.print(f"[dim]Need at least {agent_loop.preserve_recent_messages + 3} messages.[/dim]")
-                else:
-                    agent_loop._compact_context()
-                continue
-
-            try:
-                # Create TodoSpinner that shows task list + spinner
-                spinner = TodoSpinner(console, todo_manager)
-                spinner.start()
-
-                # Set spinner callbacks on approval manager for user input prompts
-                if approval_manager:
-                    approval_manager.pause_spinner = spinner.stop
-                    approval_manager.resume_spinner = spinner.start
-
-                try:
-                    # Pass callbacks to stop/start spinner during AskUserQuestion
-                    # Also pass update callback to refresh todo display
-                    response = agent_loop.run(
-                        user_input,
-                        pause_spinner_callback=spinner.stop,
-                        resume_spinner_callback=spinner.start,
-                        update_spinner_callback=spinner.update
-                    )
-                finally:
-                    # Ensure spinner is stopped
-                    spinner.stop()
-
-                console.print()
-                console.print(Markdown(response))
-
-                # Show todo panel if there are todos (final state)
-                show_todo_panel(todo_manager)
-
-                # Show context usage after each response
-                show_context_status(agent_loop)
-
-            except RateLimitError:
-                console.print("\n[red bold]⚠️  Rate Limit Exceeded[/red bold]")
-                console.print("[yellow]Please wait a moment before trying again.[/yellow]")
-                console.print("[dim]Tip: You can use 'reset' to reduce context size.[/dim]")
-            except APIError as e:
-                console.print("\n[red bold]⚠️  API Error[/red bold]")
-                console.print(f"[yellow]{str(e)}[/yellow]")
-                console.print("[dim]Please check your connection and API key.[/dim]")
-
-        except KeyboardInterrupt:
-            console.print("\n[dim]Use 'exit' to quit[/dim]")
-        except EOFError:
-            break
-
-
-@cli.command()
-@click.argument("message")
-@click.pass_context
-def ask(ctx: click.Context, message: str) -> None:
-    """Ask a single question and get a response."""
-    check_api_key()
-    config = ctx.obj["config"]
-
-    provider = get_provider(config.get("provider", "claude"), config)
-
-    try:
-        with console.status("[bold green]Thinking...[/bold green]"):
-            response = provider.simple_chat(message)
-
-        console.print(Markdown(response))
-    except RateLimitError:
-        console.print("\n[red bold]⚠️  Rate Limit Exceeded[/red bold]")
-        console.print("[yellow]Please wait a moment before trying again.[/yellow]")
-        sys.exit(1)
-    except APIError as e:
-        console.print("\n[red bold]⚠️  API Error[/red bold]")
-        console.print(f"[yellow]{str(e)}[/yellow]")
-        console.print("[dim]Please check your connection and API key.[/dim]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.argument("message")
-@click.option(
-    "--model", "-m",
-    default=None,
-    help="Model to use (e.g., claude-sonnet-4-20250514)",
-)
-@click.option(
-    "--approval/--no-approval",
-    default=True,
-    help="Require approval for file modifications (default: enabled)",
-)
-@click.option(
-    "--debug",
-    is_flag=True,
-    default=False,
-    help="Enable debug output (shows LLM requests, tool executions, etc.)",
-)
-@click.pass_context
-def run(ctx: click.Context, message: str, model: str | None, approval: bool, debug: bool) -> None:
-    """Run agent with a single task (with tools)."""
-    check_api_key()
-    config = ctx.obj["config"]
-
-    # Override Config with CLI options
-    if model:
-        config.set("model", model)
-    config.set("approval_enabled", approval)
-    config.set("debug", debug)
-
-    # Create TodoManager (per-session instance)
-    todo_manager = TodoManager()
-
-    # Create approval manager if enabled
-    approval_manager = ApprovalManager(enabled=approval) if approval else None
-
-    # Create executor with approval plugin and TodoManager
-    tools = get_all_tools(todo_manager=todo_manager)
-    executor = ToolExecutor(tools=tools, approval_manager=approval_manager)
-
-    # Create agent loop with config and executor
-    agent_loop = AgentLoop(
-        config=config,
-        executor=executor,
-        todo_manager=todo_manager,
-    )
-
-    if approval:
-        console.print("[green]✓ Approval mode enabled[/green]")
-        console.print("[dim]You will be asked before file modifications[/dim]\n")
-    else:
-        console.print("[yellow]⚠️  Approval mode disabled[/yellow]")
-        console.print("[dim]Files will be modified without confirmation[/dim]\n")
-
-    if debug:
-        console.print("[cyan]🔍 Debug mode enabled[/cyan]\n")
-
-    # Add spacing before spinner
-    console.print()
-
-    try:
-        # Create TodoSpinner that shows task list + spinner
-        spinner = TodoSpinner(console, todo_manager)
-        spinner.start()
-
-        # Set spinner callbacks on approval manager for user input prompts
-        if approval_manager:
-            approval_manager.pause_spinner = spinner.stop
-            approval_manager.resume_spinner = spinner.start
-
-        try:
-            response = agent_loop.run(
-                message,
-                pause_spinner_callback=spinner.stop,
-                resume_spinner_callback=spinner.start,
-                update_spinner_callback=spinner.update
-            )
-        finally:
-            spinner.stop()
-
-        console.print(Markdown(response))
-
-        # Show todo panel if there are todos (final state)
-        show_todo_panel(todo_manager)
-
-    except RateLimitError:
-        console.print("\n[red bold]⚠️  Rate Limit Exceeded[/red bold]")
-        console.print("[yellow]Please wait a moment before trying again.[/yellow]")
-    except APIError as e:
-        console.print("\n[red bold]⚠️  API Error[/red bold]")
-        console.print(f"[yellow]{str(e)}[/yellow]")
-        console.print("[dim]Please check your connection and API key.[/dim]")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
     cli()
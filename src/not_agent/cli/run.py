@@ -0,0 +1,91 @@
+"""One-shot agent task command."""
+
+import click
+
+from not_agent.cli.common import (
+    TodoSpinner,
+    _build_agent,
+    _md,
+    _with_api_errors,
+    _write_captured,
+    check_api_key,
+    console,
+    show_todo_panel,
+)
+
+
+@click.command()
+@click.argument("message")
+@click.option(
+    "--model",
+    "-m",
+    default=None,
+    help="Model to use (e.g., claude-sonnet-4-20250514)",
+)
+@click.option(
+    "--approval/--no-approval",
+    default=True,
+    help="Require approval for file modifications (default: enabled)",
+)
+@click.option(
+    "--debug",
+    is_flag=True,
+    default=False,
+    help="Enable debug output (shows LLM requests, tool executions, etc.)",
+)
+@click.pass_context
+@_with_api_errors
+def run(
+    ctx: click.Context, message: str, model: str | None, approval: bool, debug: bool
+) -> None:
+    """Run agent with a single task (with tools)."""
+    check_api_key()
+    config = ctx.obj["config"]
+
+    # Override Config with CLI options
+    if model:
+        config.set("model", model)
+    config.set("approval_enabled", approval)
+    config.set("debug", debug)
+
+    agent_loop, todo_manager, approval_manager = _build_agent(config, approval)
+
+    if approval:
+        console.print("[green]✓ Approval mode enabled[/green]")
+        console.print("[dim]You will be asked before file modifications[/dim]\n")
+    else:
+        console.print("[yellow]⚠️  Approval mode disabled[/yellow]")
+        console.print("[dim]Files will be modified without confirmation[/dim]\n")
+
+    if debug:
+        console.print("[cyan]🔍 Debug mode enabled[/cyan]\n")
+
+    # Add spacing before spinner
+    console.print()
+
+    # Create TodoSpinner that shows task list + spinner
+    spinner = TodoSpinner(console, todo_manager)
+    spinner.start()
+
+    # Set spinner callbacks on approval manager for user input prompts
+    if approval_manager:
+        approval_manager.pause_spinner = spinner.pause
+        approval_manager.resume_spinner = spinner.resume
+
+    try:
+        response = agent_loop.run(
+            message,
+            pause_spinner_callback=spinner.pause,
+            resume_spinner_callback=spinner.resume,
+            update_spinner_callback=spinner.update,
+        )
+    finally:
+        spinner.stop()
+
+    # Render the response block, then write it in one go
+    with console.capture() as capture:
+        console.print(_md(response))
+
+        # Show todo panel if there are todos (final state)
+        show_todo_panel(todo_manager)
+    _write_captured(capture.get())
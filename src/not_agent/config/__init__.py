@@ -1,9 +1,10 @@
 """Config module - Configuration management."""
 
-from .config import Config
+from .config import Config, clear_env_cache
 from .defaults import DEFAULT_CONFIG
 
 __all__ = [
     "Config",
     "DEFAULT_CONFIG",
+    "clear_env_cache",
 ]
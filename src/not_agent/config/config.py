@@ -2,11 +2,117 @@
 
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from .defaults import DEFAULT_CONFIG
 
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Global config file (~/.not_agent/config.json)
+GLOBAL_CONFIG_PATH = Path.home() / ".not_agent" / "config.json"
+# Project config file, relative to the working directory
+PROJECT_CONFIG_FILE = ".not_agent.json"
+
+# Environment variable value parsing
+_ENV_PREFIX = "NOT_AGENT_"
+_TRUE = frozenset({"true", "yes", "1"})
+_FALSE = frozenset({"false", "no", "0"})
+# Accept exactly what int()/float() accept (after strip()), including
+# digit-group underscores and inf/nan, without raising on plain strings
+_DIGITS = r"\d+(?:_\d+)*"
+_INT_RE = re.compile(rf"[+-]?{_DIGITS}")
+_FLOAT_RE = re.compile(
+    rf"[+-]?(?:(?:{_DIGITS}\.?(?:{_DIGITS})?|\.{_DIGITS})(?:e[+-]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)",
+    re.IGNORECASE,
+)
+
+# Parsed config files by path: ((st_mtime_ns, st_size, st_ino), data).
+# Size and inode catch rewrites and replace-by-rename within the mtime
+# granularity of coarse filesystems.
+_FILE_CACHE: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    """Load a JSON config file, re-parsing it only when the file changes.
+
+    Missing or invalid files yield an empty dict. The returned dict is
+    shared between callers and must not be modified.
+    """
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return {}
+
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        with open(key, "rb") as f:
+            data = _loads(f.read())
+    except (ValueError, OSError):
+        data = {}  # Ignore invalid config files
+    if not isinstance(data, dict):
+        data = {}
+    _FILE_CACHE[key] = (stamp, data)
+    return data
+
+
+def _parse_env_value(value: str) -> Any:
+    """Parse environment variable value to appropriate type."""
+    # Boolean
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+
+    # int() and float() ignore surrounding whitespace
+    number = value.strip()
+
+    # Integer
+    if _INT_RE.fullmatch(number):
+        return int(number)
+
+    # Float
+    if _FLOAT_RE.fullmatch(number):
+        return float(number)
+
+    # String
+    return value
+
+
+@lru_cache(maxsize=1)
+def _not_agent_env() -> dict[str, Any]:
+    """Parse the NOT_AGENT_* environment variables once per process.
+
+    The returned dict is shared and must not be modified. Call
+    clear_env_cache() after changing the environment.
+    """
+    environ = os.environ
+    start = len(_ENV_PREFIX)
+    return {
+        key[start:].lower(): _parse_env_value(environ[key])
+        for key in environ
+        if key.startswith(_ENV_PREFIX)
+    }
+
+
+def clear_env_cache() -> None:
+    """Forget the parsed NOT_AGENT_* variables so the next Config re-reads them."""
+    _not_agent_env.cache_clear()
+
 
 class Config:
     """
@@ -15,7 +121,6 @@ class Config:
     """
 
     def __init__(self) -> None:
-        self._config: dict[str, Any] = {}
         self._load_defaults()
         self._load_global()
         self._load_project()
@@ -39,58 +144,23 @@ class Config:
 
     def _load_defaults(self) -> None:
         """Load defaults."""
-        self._config.update(DEFAULT_CONFIG)
+        self._config: dict[str, Any] = dict(DEFAULT_CONFIG)
 
     def _load_global(self) -> None:
         """Load global config file (~/.not_agent/config.json)."""
-        global_path = Path.home() / ".not_agent" / "config.json"
-        if global_path.exists():
-            try:
-                with open(global_path) as f:
-                    self._config.update(json.load(f))
-            except (json.JSONDecodeError, OSError):
-                pass  # Ignore invalid config files
+        self._config.update(_load_json(GLOBAL_CONFIG_PATH))
 
     def _load_project(self) -> None:
         """Load project config file (.not_agent.json)."""
-        project_path = Path.cwd() / ".not_agent.json"
-        if project_path.exists():
-            try:
-                with open(project_path) as f:
-                    self._config.update(json.load(f))
-            except (json.JSONDecodeError, OSError):
-                pass
+        self._config.update(_load_json(Path.cwd() / PROJECT_CONFIG_FILE))
 
     def _load_env(self) -> None:
         """Load environment variables (NOT_AGENT_*)."""
-        prefix = "NOT_AGENT_"
-        for key, value in os.environ.items():
-            if key.startswith(prefix):
-                config_key = key[len(prefix):].lower()
-                self._config[config_key] = self._parse_value(value)
+        self._config.update(_not_agent_env())
 
     def _parse_value(self, value: str) -> Any:
         """Parse environment variable value to appropriate type."""
-        # Boolean
-        if value.lower() in ("true", "yes", "1"):
-            return True
-        if value.lower() in ("false", "no", "0"):
-            return False
-
-        # Integer
-        try:
-            return int(value)
-        except ValueError:
-            pass
-
-        # Float
-        try:
-            return float(value)
-        except ValueError:
-            pass
-
-        # String
-        return value
+        return _parse_env_value(value)
 
     def to_dict(self) -> dict[str, Any]:
         """Return configuration as dictionary."""
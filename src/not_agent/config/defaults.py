@@ -1,12 +1,16 @@
 """Default configuration values."""
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-DEFAULT_CONFIG: dict[str, Any] = {
+# Read-only; Config copies it into each instance
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
     # LLM settings
     "provider": "claude",
     "model": "claude-sonnet-4-20250514",
     "max_tokens": 16384,
+    "rate_limit_rpm": None,  # None = provider default (see provider.ratelimit)
+    "rate_limit_tpm": None,
 
     # Agent settings
     "max_turns": 20,
@@ -19,8 +23,8 @@ DEFAULT_CONFIG: dict[str, Any] = {
     # Permission/approval settings
     "approval_enabled": True,
     "show_diff": True,
-    "permission_rules": [],  # Custom rules (PermissionRule.from_dict format)
+    "permission_rules": (),  # Custom rules (PermissionRule.from_dict format)
 
     # Feature settings
     "debug": False,
-}
+})
@@ -8,6 +8,7 @@ from .events import (
     Event,
     EventBus,
     EventHandler,
+    BatchEventHandler,
     get_event_bus,
     # Loop events
     LoopStartedEvent,
@@ -36,6 +37,7 @@ __all__ = [
     "Event",
     "EventBus",
     "EventHandler",
+    "BatchEventHandler",
     "get_event_bus",
     # Loop events
     "LoopStartedEvent",
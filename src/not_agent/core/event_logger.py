@@ -6,6 +6,8 @@ Subscribes to events and logs them to the console.
 from typing import Callable
 
 from rich.console import Console
+from rich.style import Style
+from rich.text import Text
 
 from .events import (
     Event,
@@ -21,12 +23,19 @@ from .events import (
     ContextCompactionEvent,
 )
 
+# Separator lines around loops and turns
+_LOOP_RULE = "=" * 60
+_TURN_RULE = "─" * 60
+# Style of every log line; applied to plain text, so no markup is parsed
+_DIM = Style(dim=True)
+
 
 class EventLogger:
     """Logs events to the console for debugging.
 
     Can be attached to an EventBus to receive and display events.
-    Supports normal and verbose modes.
+    Supports normal and verbose modes. In normal mode tool executions are
+    collected per turn and logged as one summary line at turn end.
     """
 
     def __init__(
@@ -43,6 +52,21 @@ class EventLogger:
         self.console = console or Console()
         self.verbose = verbose
         self._unsubscribers: list[Callable[[], None]] = []
+        # (tool name, success, duration ms) for the current turn; normal mode
+        self._turn_tools: list[tuple[str, bool, float]] = []
+        # Formatters for events with dedicated output; looked up by exact
+        # type, as the bus dispatches
+        self._formatters: dict[type[Event], Callable[[Event], str | None]] = {
+            LoopStartedEvent: self._format_loop_started,  # type: ignore[dict-item]
+            LoopCompletedEvent: self._format_loop_completed,  # type: ignore[dict-item]
+            TurnStartedEvent: self._format_turn_started,  # type: ignore[dict-item]
+            TurnCompletedEvent: self._format_turn_completed,  # type: ignore[dict-item]
+            ToolExecutionStartedEvent: self._format_tool_started,  # type: ignore[dict-item]
+            ToolExecutionCompletedEvent: self._format_tool_completed,  # type: ignore[dict-item]
+            LLMResponseEvent: self._format_llm_response,  # type: ignore[dict-item]
+            StateChangedEvent: self._format_state_changed,  # type: ignore[dict-item]
+            ContextCompactionEvent: self._format_context_compaction,  # type: ignore[dict-item]
+        }
 
     def attach(self, bus: EventBus) -> None:
         """Attach to an event bus and start logging.
@@ -50,27 +74,25 @@ class EventLogger:
         Args:
             bus: The event bus to subscribe to
         """
-        # Define handlers for specific events
-        handlers: list[tuple[type[Event], Callable[[Event], None]]] = [
-            (LoopStartedEvent, self._on_loop_started),  # type: ignore[list-item]
-            (LoopCompletedEvent, self._on_loop_completed),  # type: ignore[list-item]
-            (TurnStartedEvent, self._on_turn_started),  # type: ignore[list-item]
-            (TurnCompletedEvent, self._on_turn_completed),  # type: ignore[list-item]
-            (ToolExecutionStartedEvent, self._on_tool_started),  # type: ignore[list-item]
-            (ToolExecutionCompletedEvent, self._on_tool_completed),  # type: ignore[list-item]
-            (LLMResponseEvent, self._on_llm_response),  # type: ignore[list-item]
-            (StateChangedEvent, self._on_state_changed),  # type: ignore[list-item]
-            (ContextCompactionEvent, self._on_context_compaction),  # type: ignore[list-item]
-        ]
-
-        for event_type, handler in handlers:
-            unsub = bus.subscribe(event_type, handler)
-            self._unsubscribers.append(unsub)
-
-        if self.verbose:
-            # Verbose mode: log all events
-            unsub = bus.subscribe_all(self._on_any_event)
-            self._unsubscribers.append(unsub)
+        self._unsubscribers.append(bus.subscribe_batch(self.on_batch))
+
+    def on_batch(self, events: list[Event]) -> None:
+        """Log a batch of events with a single console write."""
+        lines = []
+        for event in events:
+            formatter = self._formatters.get(type(event))
+            if formatter is not None:
+                line = formatter(event)
+            elif self.verbose:
+                line = f"  [EVENT] {event.event_type}"
+            else:
+                continue
+            if line is not None:
+                lines.append(line)
+
+        if lines:
+            # Plain text, so Rich skips both markup parsing and highlighting
+            self.console.print(Text("\n".join(lines), style=_DIM))
 
     def detach(self) -> None:
         """Detach from the event bus and stop logging."""
@@ -79,84 +101,74 @@ class EventLogger:
         self._unsubscribers.clear()
 
     # -------------------------------------------------------------------------
-    # Event Handlers
+    # Event Formatters (return None to skip the event)
     # -------------------------------------------------------------------------
 
-    def _on_loop_started(self, event: LoopStartedEvent) -> None:
-        """Handle loop started event."""
-        self.console.print(f"[dim]{'=' * 60}[/dim]")
-        msg_preview = event.user_message[:80] + "..." if len(event.user_message) > 80 else event.user_message
-        self.console.print(f"[dim][LOOP START] {msg_preview}[/dim]")
-
-    def _on_loop_completed(self, event: LoopCompletedEvent) -> None:
-        """Handle loop completed event."""
-        self.console.print(f"[dim][LOOP END] {event.termination_reason}[/dim]")
-        self.console.print(
-            f"[dim]  Duration: {event.duration_ms:.0f}ms | Turns: {event.total_turns}[/dim]"
+    def _format_loop_started(self, event: LoopStartedEvent) -> str | None:
+        """Format loop started event."""
+        # One slice tells whether the message is longer than the preview
+        head = event.user_message[:81]
+        msg_preview = head if len(head) <= 80 else head[:80] + "..."
+        return f"{_LOOP_RULE}\n[LOOP START] {msg_preview}"
+
+    def _format_loop_completed(self, event: LoopCompletedEvent) -> str | None:
+        """Format loop completed event."""
+        return (
+            f"[LOOP END] {event.termination_reason}\n"
+            f"  Duration: {event.duration_ms:.0f}ms | Turns: {event.total_turns}\n"
+            f"{_LOOP_RULE}"
         )
-        self.console.print(f"[dim]{'=' * 60}[/dim]")
-
-    def _on_turn_started(self, event: TurnStartedEvent) -> None:
-        """Handle turn started event."""
-        self.console.print(f"[dim]{'─' * 60}[/dim]")
-        self.console.print(f"[dim][TURN {event.turn_number}/{event.max_turns}][/dim]")
-
-    def _on_turn_completed(self, event: TurnCompletedEvent) -> None:
-        """Handle turn completed event."""
-        if event.tool_calls_count > 0:
-            self.console.print(
-                f"[dim]  Turn {event.turn_number} completed: {event.tool_calls_count} tool(s)[/dim]"
-            )
-
-    def _on_tool_started(self, event: ToolExecutionStartedEvent) -> None:
-        """Handle tool execution started event."""
-        self.console.print(f"[dim]  ▶ {event.tool_name}[/dim]")
-
-    def _on_tool_completed(self, event: ToolExecutionCompletedEvent) -> None:
-        """Handle tool execution completed event."""
+
+    def _format_turn_started(self, event: TurnStartedEvent) -> str | None:
+        """Format turn started event."""
+        self._turn_tools.clear()
+        return f"{_TURN_RULE}\n[TURN {event.turn_number}/{event.max_turns}]"
+
+    def _format_turn_completed(self, event: TurnCompletedEvent) -> str | None:
+        """Format turn completed event."""
+        if event.tool_calls_count == 0:
+            return None
+        summary = f"  Turn {event.turn_number} completed: {event.tool_calls_count} tool(s)"
+        tools = self._turn_tools
+        if not tools:
+            return summary
+
+        failed = sum(1 for _, success, _ in tools if not success)
+        total_ms = sum(duration for _, _, duration in tools)
+        names = ", ".join(name for name, _, _ in tools)
+        tools.clear()
+        return f"{summary} ({failed} failed, {total_ms:.0f}ms): {names}"
+
+    def _format_tool_started(self, event: ToolExecutionStartedEvent) -> str | None:
+        """Format tool execution started event."""
+        if not self.verbose:
+            return None
+        return f"  ▶ {event.tool_name}"
+
+    def _format_tool_completed(self, event: ToolExecutionCompletedEvent) -> str | None:
+        """Format tool execution completed event."""
+        if not self.verbose:
+            self._turn_tools.append((event.tool_name, event.success, event.duration_ms))
+            return None
         status = "✓" if event.success else "✗"
-        self.console.print(
-            f"[dim]  {status} {event.tool_name} ({event.duration_ms:.0f}ms)[/dim]"
-        )
+        return f"  {status} {event.tool_name} ({event.duration_ms:.0f}ms)"
 
-    def _on_llm_response(self, event: LLMResponseEvent) -> None:
-        """Handle LLM response event."""
-        self.console.print(
-            f"[dim]  LLM: {event.input_tokens}→{event.output_tokens} tokens "
-            f"({event.duration_ms:.0f}ms)[/dim]"
+    def _format_llm_response(self, event: LLMResponseEvent) -> str | None:
+        """Format LLM response event."""
+        return (
+            f"  LLM: {event.input_tokens}→{event.output_tokens} tokens "
+            f"({event.duration_ms:.0f}ms)"
         )
 
-    def _on_state_changed(self, event: StateChangedEvent) -> None:
-        """Handle state changed event."""
-        if self.verbose:
-            self.console.print(
-                f"[dim][STATE] {event.old_state} → {event.new_state}[/dim]"
-            )
-
-    def _on_context_compaction(self, event: ContextCompactionEvent) -> None:
-        """Handle context compaction event."""
-        self.console.print(
-            f"[dim]  [COMPACT] {event.tokens_before:,}→{event.tokens_after:,} tokens "
-            f"(-{event.messages_removed} msgs)[/dim]"
+    def _format_state_changed(self, event: StateChangedEvent) -> str | None:
+        """Format state changed event."""
+        if not self.verbose:
+            return None
+        return f"[STATE] {event.old_state} → {event.new_state}"
+
+    def _format_context_compaction(self, event: ContextCompactionEvent) -> str | None:
+        """Format context compaction event."""
+        return (
+            f"  [COMPACT] {event.tokens_before:,}→{event.tokens_after:,} tokens "
+            f"(-{event.messages_removed} msgs)"
         )
-
-    def _on_any_event(self, event: Event) -> None:
-        """Handle any event (verbose mode only)."""
-        # Skip events that have dedicated handlers
-        if isinstance(
-            event,
-            (
-                LoopStartedEvent,
-                LoopCompletedEvent,
-                TurnStartedEvent,
-                TurnCompletedEvent,
-                ToolExecutionStartedEvent,
-                ToolExecutionCompletedEvent,
-                LLMResponseEvent,
-                StateChangedEvent,
-                ContextCompactionEvent,
-            ),
-        ):
-            return
-
-        self.console.print(f"[dim]  [EVENT] {event.event_type}[/dim]")
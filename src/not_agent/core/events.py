@@ -4,11 +4,15 @@ This module provides a simple synchronous event bus for decoupling
 components and enabling extensibility through event subscription.
 """
 
+import itertools
+import threading
+import time
 from abc import ABC
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, TypeVar
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Mapping, TypeVar
 
 from rich.console import Console
 
@@ -16,15 +20,20 @@ _console = Console(stderr=True)
 
 # Type aliases
 EventHandler = Callable[["Event"], None]
+BatchEventHandler = Callable[[list["Event"]], None]
 T = TypeVar("T", bound="Event")
 
+# Shared read-only default for mapping fields, instead of a dict per
+# event (dataclass refuses it as a plain default, hence the factory)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 # =============================================================================
 # Base Event Class
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Event(ABC):
     """Base class for all events.
 
@@ -32,12 +41,22 @@ class Event(ABC):
     specific attributes as dataclass fields.
     """
 
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Wall-clock creation time; an int is cheaper to create than a datetime
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
     @property
-    def event_type(self) -> str:
-        """Return the event type name (class name)."""
-        return self.__class__.__name__
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+    # Event type name (class name); set once per class
+    event_type: ClassVar[str] = "Event"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Explicit super(): slots=True replaces the class, and the
+        # zero-argument form would still refer to the original one
+        super(Event, cls).__init_subclass__(**kwargs)
+        cls.event_type = cls.__name__
 
 
 # =============================================================================
@@ -45,7 +64,7 @@ class Event(ABC):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopStartedEvent(Event):
     """Emitted when the agent loop starts."""
 
@@ -53,7 +72,7 @@ class LoopStartedEvent(Event):
     user_message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopCompletedEvent(Event):
     """Emitted when the agent loop completes."""
 
@@ -63,7 +82,7 @@ class LoopCompletedEvent(Event):
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnStartedEvent(Event):
     """Emitted when a new turn starts."""
 
@@ -71,7 +90,7 @@ class TurnStartedEvent(Event):
     max_turns: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnCompletedEvent(Event):
     """Emitted when a turn completes."""
 
@@ -84,7 +103,7 @@ class TurnCompletedEvent(Event):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StateChangedEvent(Event):
     """Emitted when the loop state changes."""
 
@@ -97,7 +116,7 @@ class StateChangedEvent(Event):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMRequestEvent(Event):
     """Emitted before an LLM request."""
 
@@ -105,7 +124,7 @@ class LLMRequestEvent(Event):
     has_tools: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponseEvent(Event):
     """Emitted after receiving an LLM response."""
 
@@ -121,15 +140,15 @@ class LLMResponseEvent(Event):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionStartedEvent(Event):
     """Emitted before a tool is executed."""
 
     tool_name: str = ""
-    tool_input: dict[str, Any] = field(default_factory=dict)
+    tool_input: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionCompletedEvent(Event):
     """Emitted after a tool execution completes."""
 
@@ -139,7 +158,7 @@ class ToolExecutionCompletedEvent(Event):
     output_preview: str = ""  # First 200 characters
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolApprovalRequestedEvent(Event):
     """Emitted when tool approval is requested."""
 
@@ -147,7 +166,7 @@ class ToolApprovalRequestedEvent(Event):
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolApprovalResultEvent(Event):
     """Emitted when tool approval result is received."""
 
@@ -160,7 +179,7 @@ class ToolApprovalResultEvent(Event):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageAddedEvent(Event):
     """Emitted when a message is added to the session."""
 
@@ -173,7 +192,7 @@ class MessageAddedEvent(Event):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextCompactionEvent(Event):
     """Emitted when context compaction is performed."""
 
@@ -187,17 +206,53 @@ class ContextCompactionEvent(Event):
 # =============================================================================
 
 
+# Maximum events waiting for a background EventBus; the oldest are dropped
+EVENT_QUEUE_SIZE = 10_000
+# Maximum events handed to batch handlers at once in background mode
+EVENT_BATCH_SIZE = 64
+
+
 class EventBus:
-    """Simple synchronous event bus.
+    """Simple event bus.
 
     Supports subscribing to specific event types or all events.
-    Handlers are called synchronously in subscription order.
+    Handlers are called in subscription order: synchronously by default,
+    or on a single background thread when background=True, so that slow
+    handlers (e.g. console logging) stay off the publishing thread.
     Handler errors are caught and logged but don't affect other handlers.
+
+    Background mode assumes a single publishing thread: events go into a
+    deque, whose append/popleft are atomic, so publish() takes no lock
+    unless it has to wake the idle consumer.
     """
 
-    def __init__(self) -> None:
-        self._handlers: dict[type[Event], list[EventHandler]] = defaultdict(list)
-        self._global_handlers: list[EventHandler] = []
+    def __init__(self, background: bool = False) -> None:
+        # Pending events (and flush() markers) for the consumer thread;
+        # background mode only
+        self._pending: deque[Event | threading.Event] | None = (
+            deque() if background else None
+        )
+        self._wakeup = threading.Event()
+        self._worker: threading.Thread | None = None
+        # Events discarded because the queue was full
+        self.dropped = 0
+        # Guards the subscription tables and dispatch cache fills, which
+        # the background thread reads while other threads subscribe
+        self._lock = threading.Lock()
+        # Subscriptions keyed by token, so unsubscribing is a dict pop
+        self._handlers: dict[type[Event], dict[int, EventHandler]] = defaultdict(dict)
+        self._global_handlers: dict[int, EventHandler] = {}
+        self._batch_handlers: dict[int, BatchEventHandler] = {}
+        # Immutable copy of the batch handlers, replaced on change
+        self._batch_snapshot: tuple[BatchEventHandler, ...] = ()
+        self._tokens = itertools.count()
+        # Number of live subscriptions of any kind; publish() returns at
+        # once while it is zero
+        self._subscriber_count = 0
+        # Handlers to call per event type (type-specific, then global);
+        # filled lazily and cleared on any subscription change, both
+        # under _lock
+        self._dispatch_cache: dict[type[Event], tuple[EventHandler, ...]] = {}
 
     def subscribe(
         self,
@@ -213,13 +268,17 @@ class EventBus:
         Returns:
             Unsubscribe function - call to remove the subscription
         """
-        self._handlers[event_type].append(handler)  # type: ignore[arg-type]
+        with self._lock:
+            token = next(self._tokens)
+            self._handlers[event_type][token] = handler  # type: ignore[assignment]
+            self._subscriber_count += 1
+            self._dispatch_cache.clear()
 
         def unsubscribe() -> None:
-            try:
-                self._handlers[event_type].remove(handler)  # type: ignore[arg-type]
-            except ValueError:
-                pass  # Already removed
+            with self._lock:
+                if self._handlers[event_type].pop(token, None) is not None:
+                    self._subscriber_count -= 1
+                self._dispatch_cache.clear()
 
         return unsubscribe
 
@@ -232,13 +291,45 @@ class EventBus:
         Returns:
             Unsubscribe function - call to remove the subscription
         """
-        self._global_handlers.append(handler)
+        with self._lock:
+            token = next(self._tokens)
+            self._global_handlers[token] = handler
+            self._subscriber_count += 1
+            self._dispatch_cache.clear()
 
         def unsubscribe() -> None:
-            try:
-                self._global_handlers.remove(handler)
-            except ValueError:
-                pass  # Already removed
+            with self._lock:
+                if self._global_handlers.pop(token, None) is not None:
+                    self._subscriber_count -= 1
+                self._dispatch_cache.clear()
+
+        return unsubscribe
+
+    def subscribe_batch(self, handler: BatchEventHandler) -> Callable[[], None]:
+        """Subscribe to all events, delivered in lists.
+
+        In background mode each list holds the events that were queued
+        when the bus thread woke up (up to EVENT_BATCH_SIZE), so the
+        handler can process them in one go; otherwise it gets one event
+        per publish. Batch handlers run after the per-event handlers.
+
+        Args:
+            handler: Callback function that receives a list of events
+
+        Returns:
+            Unsubscribe function - call to remove the subscription
+        """
+        with self._lock:
+            token = next(self._tokens)
+            self._batch_handlers[token] = handler
+            self._batch_snapshot = tuple(self._batch_handlers.values())
+            self._subscriber_count += 1
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if self._batch_handlers.pop(token, None) is not None:
+                    self._batch_snapshot = tuple(self._batch_handlers.values())
+                    self._subscriber_count -= 1
 
         return unsubscribe
 
@@ -247,44 +338,136 @@ class EventBus:
 
         Type-specific handlers are called first, then global handlers.
         Handler errors are caught and printed but don't stop other handlers.
+        In background mode the event is only queued; see flush().
 
         Args:
             event: The event to publish
         """
-        # Type-specific handlers
-        for handler in self._handlers.get(type(event), []):
+        if not self._subscriber_count:
+            return
+        if self._pending is None:
+            self._dispatch([event])
+            return
+
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._drain, name="EventBus", daemon=True
+            )
+            self._worker.start()
+        pending = self._pending
+        if len(pending) >= EVENT_QUEUE_SIZE:
             try:
-                handler(event)
-            except Exception as e:
-                _console.print(f"[yellow][EventBus][/yellow] Handler error for {event.event_type}: {e}")
-
-        # Global handlers
-        for handler in self._global_handlers:
+                oldest = pending.popleft()
+            except IndexError:  # drained meanwhile
+                pass
+            else:
+                if isinstance(oldest, threading.Event):
+                    oldest.set()  # Everything before the marker was handled
+                else:
+                    self.dropped += 1
+        self._enqueue(event)
+
+    def flush(self) -> None:
+        """Block until all queued events have been handled."""
+        if self._pending is None or self._worker is None:
+            return
+        done = threading.Event()
+        self._enqueue(done)
+        done.wait()
+
+    def _enqueue(self, item: "Event | threading.Event") -> None:
+        """Queue an item for the consumer thread and wake it if idle."""
+        assert self._pending is not None
+        self._pending.append(item)
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def _drain(self) -> None:
+        """Background thread: handle queued events in order, in batches.
+
+        Each wake-up takes everything queued so far, in batches of up to
+        EVENT_BATCH_SIZE, without waiting for more.
+        """
+        assert self._pending is not None
+        pending, wakeup = self._pending, self._wakeup
+        while True:
+            wakeup.wait()
+            # Cleared before draining, so an event queued from here on
+            # either gets drained now or sets the flag again
+            wakeup.clear()
+            batch: list[Event] = []
+            while pending:
+                item = pending.popleft()
+                if isinstance(item, threading.Event):  # flush() marker
+                    if batch:
+                        self._dispatch(batch)
+                        batch = []
+                    item.set()
+                    continue
+                batch.append(item)
+                if len(batch) == EVENT_BATCH_SIZE:
+                    self._dispatch(batch)
+                    batch = []
+            if batch:
+                self._dispatch(batch)
+
+    def _dispatch(self, events: list[Event]) -> None:
+        """Call the per-event handlers for each event, then batch handlers.
+
+        Cache hits take no lock; a miss builds the handler tuple under
+        _lock, so it never sees a table mid-change and cannot store an
+        entry that a concurrent subscription change has invalidated.
+        """
+        cache = self._dispatch_cache
+        for event in events:
+            event_type = type(event)
+            handlers = cache.get(event_type)
+            if handlers is None:
+                with self._lock:
+                    type_handlers = self._handlers.get(event_type)
+                    handlers = cache[event_type] = (
+                        *(type_handlers.values() if type_handlers else ()),
+                        *self._global_handlers.values(),
+                    )
+
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    _console.print(
+                        f"[yellow][EventBus][/yellow] Handler error for "
+                        f"{event.event_type}: {e}"
+                    )
+
+        for batch_handler in self._batch_snapshot:
             try:
-                handler(event)
+                batch_handler(events)
             except Exception as e:
-                _console.print(f"[yellow][EventBus][/yellow] Global handler error for {event.event_type}: {e}")
+                _console.print(f"[yellow][EventBus][/yellow] Batch handler error: {e}")
 
     def clear(self) -> None:
         """Clear all subscriptions."""
-        self._handlers.clear()
-        self._global_handlers.clear()
+        with self._lock:
+            self._handlers.clear()
+            self._global_handlers.clear()
+            self._batch_handlers.clear()
+            self._batch_snapshot = ()
+            self._subscriber_count = 0
+            self._dispatch_cache.clear()
 
 
 # =============================================================================
 # Global EventBus Instance
 # =============================================================================
 
-_default_bus: EventBus | None = None
+# Created at import (cheap: no thread until background use), so there
+# is no first-call race between threads
+_default_bus = EventBus()
 
 
 def get_event_bus() -> EventBus:
     """Get the default global event bus instance.
 
-    Creates a new instance on first call. Use this for simple cases
-    where dependency injection is not needed.
+    Use this for simple cases where dependency injection is not needed.
     """
-    global _default_bus
-    if _default_bus is None:
-        _default_bus = EventBus()
     return _default_bus
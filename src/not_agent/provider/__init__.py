@@ -3,6 +3,7 @@
 from .base import BaseProvider, ProviderResponse
 from .claude import ClaudeProvider
 from .registry import get_provider, register_provider, list_providers
+from .ratelimit import SlidingWindowLimiter, call_with_backoff, limiter_from_config
 
 __all__ = [
     "BaseProvider",
@@ -11,4 +12,7 @@ __all__ = [
     "get_provider",
     "register_provider",
     "list_providers",
+    "SlidingWindowLimiter",
+    "call_with_backoff",
+    "limiter_from_config",
 ]
@@ -2,11 +2,16 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from not_agent.tools.base import BaseTool
 
+# Shared read-only default for usage, instead of a dict per response
+# (dataclass refuses it as a plain default, hence the factory)
+_EMPTY_USAGE: Mapping[str, int] = MappingProxyType({})
+
 
 @dataclass
 class ProviderResponse:
@@ -14,7 +19,8 @@ class ProviderResponse:
 
     content: list[Any]  # TextBlock, ToolUseBlock, etc.
     stop_reason: str
-    usage: dict[str, int] = field(default_factory=dict)  # input_tokens, output_tokens
+    # input_tokens, output_tokens
+    usage: Mapping[str, int] = field(default_factory=lambda: _EMPTY_USAGE)
 
 
 class BaseProvider(ABC):
@@ -48,6 +54,23 @@ class BaseProvider(ABC):
         """
         pass
 
+    def simple_chat(self, message: str, system: str | None = None) -> str:
+        """Single-turn chat without tools; returns the response text."""
+        response = self.chat([{"role": "user", "content": message}], system=system)
+        return "\n".join(
+            block.text for block in response.content if hasattr(block, "text")
+        )
+
+    def stream_simple_chat(
+        self, message: str, system: str | None = None
+    ) -> Iterator[str]:
+        """Streaming variant of simple_chat(); yields text deltas.
+
+        Default implementation yields the whole response at once.
+        Override for providers that support streaming.
+        """
+        yield self.simple_chat(message, system)
+
     def format_tool(self, tool: "BaseTool") -> dict[str, Any]:
         """
         Convert tool to provider format.
@@ -1,10 +1,11 @@
 """Claude provider implementation."""
 
+import atexit
 import os
 import sys
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterator, TYPE_CHECKING
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from rich.console import Console
 
 from .base import BaseProvider, ProviderResponse
@@ -14,6 +15,26 @@ if TYPE_CHECKING:
 
 _console = Console(stderr=True)
 
+# Anthropic clients shared by all providers in the process, keyed by API key,
+# so their HTTP connection pools are reused
+_CLIENTS: dict[str, Anthropic] = {}
+
+
+def _shared_client(api_key: str) -> Anthropic:
+    """Return the process-wide Anthropic client for this API key."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = _CLIENTS[api_key] = Anthropic(api_key=api_key)
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close shared clients' HTTP pools at interpreter exit."""
+    for client in _CLIENTS.values():
+        client.close()
+    _CLIENTS.clear()
+
 
 class ClaudeProvider(BaseProvider):
     """Anthropic Claude API provider."""
@@ -34,7 +55,10 @@ class ClaudeProvider(BaseProvider):
             )
             sys.exit(1)
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = _shared_client(api_key)
+        self._api_key = api_key
+        # Created on demand by simple_chat_async(); bound to one event loop
+        self._async_client: AsyncAnthropic | None = None
         self.model = config.get("model", "claude-sonnet-4-20250514")
 
     def chat(
@@ -59,8 +83,9 @@ class ClaudeProvider(BaseProvider):
 
         response = self.client.messages.create(**kwargs)
 
+        # The SDK already returns a fresh list; the Message is discarded
         return ProviderResponse(
-            content=list(response.content),
+            content=response.content,
             stop_reason=response.stop_reason,
             usage={
                 "input_tokens": response.usage.input_tokens,
@@ -88,3 +113,39 @@ class ClaudeProvider(BaseProvider):
             block.text for block in response.content if hasattr(block, "text")
         ]
         return "\n".join(text_content)
+
+    def stream_simple_chat(
+        self, message: str, system: str | None = None
+    ) -> Iterator[str]:
+        """Streaming variant of simple_chat(); yields text deltas."""
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=self.config.get("max_tokens", 4096),
+            system=system or "You are a helpful coding assistant.",
+            messages=[{"role": "user", "content": message}],
+        ) as stream:
+            yield from stream.text_stream
+
+    async def simple_chat_async(self, message: str, system: str | None = None) -> str:
+        """Async variant of simple_chat() for concurrent requests.
+
+        Call aclose() before the event loop ends.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncAnthropic(api_key=self._api_key)
+
+        response = await self._async_client.messages.create(
+            model=self.model,
+            max_tokens=self.config.get("max_tokens", 4096),
+            system=system or "You are a helpful coding assistant.",
+            messages=[{"role": "user", "content": message}],
+        )
+        return "\n".join(
+            block.text for block in response.content if hasattr(block, "text")
+        )
+
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
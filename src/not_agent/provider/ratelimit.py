@@ -0,0 +1,189 @@
+"""Client-side request/token rate limiting."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Callable, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from anthropic import RateLimitError
+
+    from not_agent.config import Config
+
+_T = TypeVar("_T")
+
+
+# Default per-provider limits (requests/minute, input tokens/minute)
+PROVIDER_LIMITS: dict[str, dict[str, int]] = {
+    "claude": {"rpm": 50, "tpm": 80_000},
+}
+
+_WINDOW = 60.0  # seconds
+
+# Rate-limit retry settings (seconds)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+_BACKOFF_JITTER = 1.0
+BACKOFF_ATTEMPTS = 8
+
+
+class SlidingWindowLimiter:
+    """Sliding one-minute window over requests and tokens.
+
+    acquire() blocks until both budgets allow another request. The request
+    limit is halved on each rate-limit error and recovers by one request
+    per minute afterwards (AIMD).
+    """
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.base_rpm = rpm
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._sleep = sleep
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+        self._decreased_at: float | None = None
+
+    def _expire(self, now: float) -> None:
+        """Drop entries older than the window."""
+        cutoff = now - _WINDOW
+        requests = self._requests
+        while requests and requests[0] <= cutoff:
+            requests.popleft()
+        tokens = self._tokens
+        while tokens and tokens[0][0] <= cutoff:
+            self._token_total -= tokens.popleft()[1]
+
+    def _recover(self, now: float) -> None:
+        """Additively restore rpm, one request per minute since the last cut."""
+        if self._decreased_at is None:
+            return
+        steps = int((now - self._decreased_at) // _WINDOW)
+        if steps:
+            self.rpm = min(self.base_rpm, self.rpm + steps)
+            self._decreased_at = (
+                None if self.rpm == self.base_rpm
+                else self._decreased_at + steps * _WINDOW
+            )
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until a request of this size fits, 0 if it fits now."""
+        wait = 0.0
+        if len(self._requests) >= self.rpm:
+            wait = self._requests[-self.rpm] + _WINDOW - now
+        # A single oversized request is let through once the window is empty
+        if self._tokens and self._token_total + tokens > self.tpm:
+            excess = self._token_total + tokens - self.tpm
+            for ts, count in self._tokens:
+                excess -= count
+                if excess <= 0:
+                    break
+            wait = max(wait, ts + _WINDOW - now)
+        return wait
+
+    def _reserve(self, tokens: int) -> float:
+        """Record the request if it fits now; otherwise return the wait."""
+        now = self._clock()
+        self._recover(now)
+        self._expire(now)
+        wait = self._wait_time(now, tokens)
+        if wait > 0:
+            return wait
+
+        self._requests.append(now)
+        if tokens:
+            self._tokens.append((now, tokens))
+            self._token_total += tokens
+        return 0.0
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until the request fits, then record it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while (wait := self._reserve(tokens)) > 0:
+            self._sleep(wait)
+            waited += wait
+        return waited
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Async variant of acquire() that yields to the event loop."""
+        waited = 0.0
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    def on_rate_limited(self) -> None:
+        """Multiplicatively decrease rpm after a 429."""
+        self.rpm = max(1, self.rpm // 2)
+        self._decreased_at = self._clock()
+
+
+def limiter_from_config(config: "Config") -> SlidingWindowLimiter:
+    """Build a limiter from config, falling back to provider defaults."""
+    limits: dict[str, Any] = PROVIDER_LIMITS.get(config.get("provider", "claude"), {})
+    rpm = config.get("rate_limit_rpm") or limits.get("rpm", 50)
+    tpm = config.get("rate_limit_tpm") or limits.get("tpm", 80_000)
+    return SlidingWindowLimiter(rpm=int(rpm), tpm=int(tpm))
+
+
+def _retry_after(error: "RateLimitError") -> float | None:
+    """Return the server's retry-after delay in seconds, if present."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def call_with_backoff(
+    fn: Callable[..., _T],
+    *args: Any,
+    limiter: SlidingWindowLimiter | None = None,
+    tokens: int = 0,
+    wait: Callable[[float, int], None] | None = None,
+    **kwargs: Any,
+) -> _T:
+    """Call fn, retrying on rate limits with exponential backoff and jitter.
+
+    Meant to wrap a single API request, so a retry repeats only that
+    request. Honors the retry-after header when the API sends one. If a
+    limiter is given, each attempt first waits for a `tokens` budget.
+    wait(delay, attempt) does the sleeping between attempts (time.sleep
+    by default), so callers can pause a spinner and report the retry.
+    The last RateLimitError is re-raised once the attempts are exhausted.
+    """
+    from anthropic import RateLimitError
+
+    for attempt in range(BACKOFF_ATTEMPTS):
+        if limiter is not None:
+            limiter.acquire(tokens)
+        try:
+            return fn(*args, **kwargs)
+        except RateLimitError as e:
+            if limiter is not None:
+                limiter.on_rate_limited()
+            if attempt == BACKOFF_ATTEMPTS - 1:
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt)
+                delay += random.uniform(0, _BACKOFF_JITTER)
+            if wait is not None:
+                wait(delay, attempt)
+            else:
+                time.sleep(delay)
+    raise AssertionError("unreachable")
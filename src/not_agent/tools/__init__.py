@@ -1,24 +1,53 @@
 """Tools module - File operations, bash execution, web search, etc."""
 
+import importlib
+from typing import Any, TYPE_CHECKING
+
 # Import registry first
-from .registry import ToolRegistry, register_tool
+from .registry import _BUILTIN_TOOLS, ToolRegistry, register_tool
 
 # Import base classes
 from .base import BaseTool, ToolResult
 
-# Import all tools (this triggers @register_tool decorators)
-from .ask_user import AskUserQuestionTool
-from .bash import BashTool
-from .edit import EditTool
-from .glob_tool import GlobTool
-from .grep import GrepTool
-from .read import ReadTool
-from .web_fetch import WebFetchTool
-from .web_search import WebSearchTool
-from .write import WriteTool
+if TYPE_CHECKING:
+    from .ask_user import AskUserQuestionTool
+    from .bash import BashTool
+    from .edit import EditTool
+    from .glob_tool import GlobTool
+    from .grep import GrepTool
+    from .read import ReadTool
+    from .todo import TodoManager, TodoReadTool, TodoWriteTool
+    from .web_fetch import WebFetchTool
+    from .web_search import WebSearchTool
+    from .write import WriteTool
 
+# Tool classes are imported on first access (see __getattr__), so importing
+# the package doesn't load every tool's dependencies (requests, bs4, rich...).
+# Name -> module, derived from the registry's built-in table
+_lazy_imports: dict[str, str] = {
+    class_name: module
+    for module, _, class_name in (
+        spec.partition(":") for spec in _BUILTIN_TOOLS.values()
+    )
+}
 # Todo tools (not auto-registered - require TodoManager injection)
-from .todo import TodoManager, TodoReadTool, TodoWriteTool
+_lazy_imports.update(dict.fromkeys(
+    ("TodoManager", "TodoReadTool", "TodoWriteTool"), f"{__name__}.todo"
+))
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _lazy_imports.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_imports})
+
 
 __all__ = [
     # Registry
@@ -43,7 +72,7 @@ __all__ = [
 ]
 
 
-def get_all_tools(todo_manager: TodoManager | None = None) -> list[BaseTool]:
+def get_all_tools(todo_manager: "TodoManager | None" = None) -> list[BaseTool]:
     """
     Get instances of all available tools.
 
@@ -56,11 +85,13 @@ def get_all_tools(todo_manager: TodoManager | None = None) -> list[BaseTool]:
     Returns:
         List of tool instances.
     """
-    # Get all registered tools from registry
+    # Get all registered tools from registry (imports each on first use)
     tools = [ToolRegistry.get(name) for name in ToolRegistry.list_tools()]
 
     # Todo tools are added only when manager is provided (requires dependency injection)
     if todo_manager is not None:
+        from .todo import TodoReadTool, TodoWriteTool
+
         tools.extend([
             TodoWriteTool(todo_manager),
             TodoReadTool(todo_manager),
@@ -1,19 +1,37 @@
 """Tool registry system."""
 
+import importlib
 from typing import Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import BaseTool
 
+# Built-in tools: name -> "module:ClassName". A tool's module is imported
+# only when the tool is first requested.
+_BUILTIN_TOOLS: dict[str, str] = {
+    "ask_user": "not_agent.tools.ask_user:AskUserQuestionTool",
+    "bash": "not_agent.tools.bash:BashTool",
+    "edit": "not_agent.tools.edit:EditTool",
+    "glob": "not_agent.tools.glob_tool:GlobTool",
+    "grep": "not_agent.tools.grep:GrepTool",
+    "read": "not_agent.tools.read:ReadTool",
+    "web_fetch": "not_agent.tools.web_fetch:WebFetchTool",
+    "web_search": "not_agent.tools.web_search:WebSearchTool",
+    "write": "not_agent.tools.write:WriteTool",
+}
+
 
 class ToolRegistry:
     """
     Tool registration and management.
 
     Uses singleton pattern for global registry management.
+    Tools are registered either as classes (@register_tool) or lazily as
+    "module:ClassName" specs, imported on first use.
     """
 
     _tools: dict[str, Type["BaseTool"]] = {}
+    _lazy: dict[str, str] = dict(_BUILTIN_TOOLS)  # Name -> "module:ClassName"
     _instances: dict[str, "BaseTool"] = {}
     _instance_kwargs: dict[str, dict] = {}  # Per-tool initialization arguments
 
@@ -40,6 +58,33 @@ class ToolRegistry:
         cls._tools[tool_name] = tool_class
         return tool_class
 
+    @classmethod
+    def register_lazy(cls, name: str, spec: str) -> None:
+        """
+        Register a tool by import path without importing it.
+
+        Args:
+            name: Tool name
+            spec: "module:ClassName" of the tool class
+        """
+        cls._lazy[name] = spec
+
+    @classmethod
+    def _load(cls, name: str) -> bool:
+        """Import a lazily registered tool if needed; False if unknown."""
+        if name in cls._tools:
+            return True
+        spec = cls._lazy.get(name)
+        if spec is None:
+            return False
+
+        module_path, class_name = spec.split(":")
+        tool_class = getattr(importlib.import_module(module_path), class_name)
+        # Importing usually registers it already via @register_tool
+        if name not in cls._tools:
+            cls.register(tool_class, name)
+        return True
+
     @classmethod
     def get(cls, name: str, **kwargs) -> "BaseTool":
         """
@@ -52,8 +97,8 @@ class ToolRegistry:
         Returns:
             Tool instance
         """
-        if name not in cls._tools:
-            raise KeyError(f"Unknown tool: {name}. Available: {list(cls._tools.keys())}")
+        if not cls._load(name):
+            raise KeyError(f"Unknown tool: {name}. Available: {cls.list_tools()}")
 
         # Cache key: name + kwargs hash
         cache_key = name
@@ -78,7 +123,7 @@ class ToolRegistry:
             List of tool instances
         """
         tools = []
-        for name in cls._tools:
+        for name in cls.list_tools():
             try:
                 tool = cls.get(name, **shared_kwargs)
                 tools.append(tool)
@@ -91,26 +136,28 @@ class ToolRegistry:
     @classmethod
     def get_tool_class(cls, name: str) -> Type["BaseTool"]:
         """Get tool class (without instantiation)."""
-        if name not in cls._tools:
+        if not cls._load(name):
             raise KeyError(f"Unknown tool: {name}")
         return cls._tools[name]
 
     @classmethod
     def list_tools(cls) -> list[str]:
-        """Return list of registered tool names."""
-        return list(cls._tools.keys())
+        """Return list of registered tool names (without importing them)."""
+        return list(dict.fromkeys((*cls._lazy, *cls._tools)))
 
     @classmethod
     def clear(cls) -> None:
-        """Clear registry (for testing)."""
+        """Reset registry to the built-in tools (for testing)."""
         cls._tools.clear()
+        cls._lazy.clear()
+        cls._lazy.update(_BUILTIN_TOOLS)
         cls._instances.clear()
         cls._instance_kwargs.clear()
 
     @classmethod
     def is_registered(cls, name: str) -> bool:
         """Check if tool is registered."""
-        return name in cls._tools
+        return name in cls._tools or name in cls._lazy
 
 
 def register_tool(cls: Type["BaseTool"]) -> Type["BaseTool"]:
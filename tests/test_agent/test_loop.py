@@ -0,0 +1,102 @@
+"""Tests for AgentLoop."""
+
+import pytest
+from anthropic.types import TextBlock, ToolUseBlock
+
+from not_agent.agent import AgentLoop
+from not_agent.provider import ProviderResponse
+
+from tests.test_provider.test_ratelimit import rate_limit_error
+
+
+class FakeProvider:
+    """정해진 응답을 차례로 돌려주는 프로바이더. 예외는 발생시킨다."""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.requests: list[list] = []
+
+    def chat(self, messages, **kwargs):
+        self.requests.append(messages)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def agent_loop(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    return AgentLoop()
+
+
+def text_response(text: str) -> ProviderResponse:
+    return ProviderResponse(
+        content=[TextBlock(type="text", text=text)], stop_reason="end_turn"
+    )
+
+
+def tool_response(name: str) -> ProviderResponse:
+    block = ToolUseBlock(type="tool_use", id="tool_1", name=name, input={})
+    return ProviderResponse(content=[block], stop_reason="tool_use")
+
+
+class FakeLimiter:
+    """acquire() 호출을 기록하는 리미터."""
+
+    def __init__(self) -> None:
+        self.acquired: list[int] = []
+
+    def acquire(self, tokens: int = 0) -> float:
+        self.acquired.append(tokens)
+        return 0.0
+
+    def on_rate_limited(self) -> None:
+        pass
+
+
+class TestAgentLoop:
+    """AgentLoop 테스트."""
+
+    def test_rate_limit_retries_only_the_request(self, agent_loop, monkeypatch):
+        """레이트 리밋 재시도는 LLM 요청만 반복하고 사용자 메시지를 다시 넣지 않는다."""
+        monkeypatch.setattr("not_agent.agent.loop.time.sleep", lambda s: None)
+        agent_loop.provider = FakeProvider(rate_limit_error("1"), text_response("done"))
+
+        assert agent_loop.run("hello") == "done"
+
+        assert len(agent_loop.session) == 1
+        first, second = agent_loop.provider.requests
+        assert first == second
+
+    def test_limiter_charged_per_request(self, agent_loop):
+        """리미터는 LLM 요청마다 그 요청의 입력 크기로 차감된다."""
+        agent_loop.limiter = FakeLimiter()
+        agent_loop.provider = FakeProvider(tool_response("missing"), text_response("done"))
+
+        agent_loop.run("hello")
+
+        first, second = agent_loop.limiter.acquired
+        assert first >= len(agent_loop.system_prompt) // 4
+        assert second > first  # The tool turn is part of the second request
+
+    def test_session_estimated_once_per_turn(self, agent_loop, monkeypatch):
+        """세션 토큰 추정은 턴마다 한 번만 하고 다음 요청이 그 값을 재사용한다."""
+        agent_loop.limiter = FakeLimiter()
+        agent_loop.provider = FakeProvider(tool_response("missing"), text_response("done"))
+        manager = agent_loop.context_manager
+        estimate = manager.estimate_tokens
+        estimates: list[int] = []
+
+        def counting_estimate(session):
+            estimates.append(estimate(session))
+            return estimates[-1]
+
+        monkeypatch.setattr(manager, "estimate_tokens", counting_estimate)
+
+        agent_loop.run("hello")
+
+        # First request, then the context check after the tool turn
+        assert len(estimates) == 2
+        system_tokens = len(agent_loop.system_prompt) // 4
+        assert agent_loop.limiter.acquired == [e + system_tokens for e in estimates]
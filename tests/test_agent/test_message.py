@@ -1,5 +1,8 @@
 """Tests for message parts and session."""
 
+import sys
+from types import SimpleNamespace
+
 import pytest
 
 from not_agent.agent.message import (
@@ -10,6 +13,7 @@ from not_agent.agent.message import (
     part_from_dict,
     part_from_anthropic,
     parts_from_content,
+    parts_to_api,
     register_part_type,
 )
 from not_agent.agent.session import Message, Session
@@ -38,6 +42,14 @@ class TestTextPart:
         part = TextPart.from_dict(data)
         assert part.text == "restored"
 
+    def test_empty_text_shared(self):
+        assert TextPart.from_dict({"part_type": "text", "text": ""}) is parts_from_content("")[0]
+
+    def test_immutable(self):
+        part = TextPart(text="hello")
+        with pytest.raises(AttributeError):
+            part.text = "changed"  # type: ignore[misc]
+
 
 class TestToolUsePart:
     """ToolUsePart 테스트."""
@@ -89,6 +101,11 @@ class TestToolUsePart:
         assert part.tool_id == "id1"
         assert part.tool_name == "glob"
 
+    def test_tool_name_interned(self):
+        name = "".join(["gl", "ob"])
+        part = ToolUsePart(tool_id="1", tool_name=name, tool_input={})
+        assert part.tool_name is sys.intern("glob")
+
 
 class TestToolResultPart:
     """ToolResultPart 테스트."""
@@ -193,6 +210,12 @@ class TestPartFromAnthropic:
         part = part_from_anthropic(block)
         assert isinstance(part, ToolResultPart)
 
+    def test_sdk_tool_use_shares_dict_input(self):
+        tool_input = {"path": "/tmp"}
+        block = SimpleNamespace(type="tool_use", id="1", name="read", input=tool_input)
+        part = part_from_anthropic(block)
+        assert part.tool_input is tool_input
+
     def test_invalid_block(self):
         with pytest.raises(ValueError, match="Cannot convert"):
             part_from_anthropic("invalid")
@@ -215,6 +238,27 @@ class TestPartsFromContent:
         parts = parts_from_content(content)
         assert len(parts) == 2
 
+    def test_unknown_block_falls_back_to_text(self):
+        parts = parts_from_content([{"type": "image"}, "raw"])
+        assert all(isinstance(p, TextPart) for p in parts)
+        assert parts[1].text == "raw"
+
+
+class TestPartsToApi:
+    """parts_to_api 변환 테스트."""
+
+    def test_matches_message_part_path(self):
+        blocks = [
+            SimpleNamespace(type="text", text="hi"),
+            SimpleNamespace(type="tool_use", id="1", name="read", input={"p": "v"}),
+            {"type": "tool_result", "tool_use_id": "1", "content": "out"},
+        ]
+        expected = [p.to_api_format() for p in parts_from_content(blocks)]
+        assert parts_to_api(blocks) == expected
+
+    def test_unknown_block_falls_back_to_text(self):
+        assert parts_to_api(["raw"]) == [{"type": "text", "text": "raw"}]
+
 
 class TestMessage:
     """Message 클래스 테스트."""
@@ -263,6 +307,30 @@ class TestMessage:
         assert tool_uses[0].tool_name == "read"
         assert tool_uses[1].tool_name == "write"
 
+    def test_parts_and_tool_uses_are_not_shared(self):
+        msg = Message(
+            role="assistant",
+            parts=[ToolUsePart(tool_id="1", tool_name="read", tool_input={})],
+        )
+        msg.get_tool_uses().clear()
+        assert len(msg.get_tool_uses()) == 1
+
+        assert isinstance(msg.parts, tuple)
+        with pytest.raises(AttributeError):
+            msg.parts.append(TextPart(text="x"))  # type: ignore[attr-defined]
+
+    def test_queries_follow_add_part(self):
+        class NotePart(TextPart):
+            pass
+
+        msg = Message(role="assistant", parts=[TextPart(text="a")])
+        msg.add_part(ToolUsePart(tool_id="1", tool_name="read", tool_input={}))
+        msg.add_part(NotePart(text="b"))
+
+        assert msg.get_text_content() == "a\nb"
+        assert [p.tool_id for p in msg.get_tool_uses()] == ["1"]
+        assert len(msg.get_parts_by_type(MessagePart)) == 3
+
     def test_to_api_format(self):
         msg = Message(
             role="user",
@@ -274,6 +342,19 @@ class TestMessage:
             "content": [{"type": "text", "text": "hello"}],
         }
 
+    def test_to_api_format_cached_until_add_part(self):
+        msg = Message(role="user", parts=[TextPart(text="hello")])
+        first = msg.to_api_format()
+        assert msg.to_api_format() is first
+
+        msg.add_part(TextPart(text="world"))
+        api = msg.to_api_format()
+        assert api is not first
+        assert api["content"] == [
+            {"type": "text", "text": "hello"},
+            {"type": "text", "text": "world"},
+        ]
+
     def test_to_dict_and_from_dict(self):
         msg = Message(
             role="assistant",
@@ -295,15 +376,28 @@ class TestMessage:
         assert isinstance(restored.parts[0], TextPart)
         assert isinstance(restored.parts[1], ToolUsePart)
 
+    def test_role_interned(self):
+        role = "".join(["assis", "tant"])
+        msg = Message.from_dict({"role": role, "parts": []})
+        assert msg.role is sys.intern("assistant")
+        assert msg.to_api_format()["role"] is sys.intern("assistant")
+
     def test_content_property_backward_compat(self):
         """content 프로퍼티 하위 호환성 테스트."""
         msg = Message(
             role="user",
             parts=[TextPart(text="test")],
         )
-        content = msg.content
+        with pytest.warns(DeprecationWarning):
+            content = msg.content
         assert content == [{"type": "text", "text": "test"}]
 
+        with pytest.warns(DeprecationWarning):
+            assert msg.content is content
+        msg.add_part(TextPart(text="more"))
+        with pytest.warns(DeprecationWarning):
+            assert len(msg.content) == 2
+
 
 class TestSession:
     """Session 클래스 테스트."""
@@ -342,6 +436,17 @@ class TestSession:
         assert isinstance(msg.parts[0], ToolResultPart)
         assert msg.parts[1].is_error is True
 
+    def test_add_tool_results_defaults(self):
+        session = Session()
+        msg = session.add_tool_results([{"tool_use_id": "1"}])
+        assert msg.parts == (ToolResultPart(tool_use_id="1", content="", is_error=False),)
+
+    def test_add_tool_results_empty(self):
+        session = Session()
+        msg = session.add_tool_results([])
+        assert msg.parts == ()
+        assert len(session) == 1
+
     def test_to_api_format(self):
         session = Session()
         session.add_user_message("hello")
@@ -350,6 +455,49 @@ class TestSession:
         assert api[0]["role"] == "user"
         assert api[0]["content"][0]["type"] == "text"
 
+    def test_to_api_format_returns_copy(self):
+        session = Session()
+        session.add_user_message("hello")
+        api = session.to_api_format()
+        api.append({"role": "user", "content": "injected"})
+        assert len(session.to_api_format()) == 1
+
+    def test_to_api_format_after_direct_messages_change(self):
+        session = Session()
+        session.add_user_message("hello")
+        session.messages.append(Message(role="assistant", parts=[TextPart(text="hi")]))
+        api = session.to_api_format()
+        assert [m["role"] for m in api] == ["user", "assistant"]
+
+        session.clear()
+        assert session.to_api_format() == []
+
+    def test_to_api_format_follows_message_edits(self):
+        """세션 안의 메시지를 바꿔도 다음 변환에 반영된다."""
+        session = Session()
+        msg = session.add_user_message("hello")
+        session.to_api_format()
+
+        msg.add_part(TextPart(text="world"))
+        session.messages[0:1] = [Message(role="user", parts=[TextPart(text="replaced")])]
+        assert session.to_api_format()[0]["content"] == [{"type": "text", "text": "replaced"}]
+
+        session.messages[0] = msg
+        assert len(session.to_api_format()[0]["content"]) == 2
+
+    def test_to_api_format_mutation_does_not_leak(self):
+        """반환된 메시지 dict를 수정해도 이후 호출에 영향이 없다."""
+        session = Session()
+        session.add_user_message("hello")
+
+        api = session.to_api_format()
+        api[0]["content"].append({"type": "text", "text": "injected"})
+        api[0]["role"] = "assistant"
+
+        assert session.to_api_format() == [
+            {"role": "user", "content": [{"type": "text", "text": "hello"}]}
+        ]
+
     def test_to_dict_and_from_dict(self):
         session = Session()
         session.add_user_message("hello")
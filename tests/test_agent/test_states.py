@@ -4,7 +4,13 @@ import time
 
 import pytest
 
-from not_agent.agent.states import LoopState, TerminationReason, LoopContext
+from not_agent.agent import states
+from not_agent.agent.states import (
+    STATE_HISTORY_LIMIT,
+    LoopContext,
+    LoopState,
+    TerminationReason,
+)
 
 
 class TestLoopState:
@@ -116,20 +122,30 @@ class TestLoopContext:
         assert ctx.duration_ms() is None
 
         # 시작만 있으면 현재까지 시간
-        ctx.start_time = time.time()
+        ctx.start_time = time.monotonic_ns()
         time.sleep(0.01)  # 10ms
         duration = ctx.duration_ms()
         assert duration is not None
         assert duration >= 10  # 최소 10ms
 
         # 종료 시간도 있으면 정확한 시간
-        ctx.end_time = ctx.start_time + 0.1  # 100ms
+        ctx.end_time = ctx.start_time + 100_000_000  # 100ms
         assert ctx.duration_ms() == pytest.approx(100, rel=0.01)
 
-    def test_record_state(self):
+    def test_record_state_without_debug(self, monkeypatch):
+        """디버그 비활성 시 상태만 변경하고 이력은 할당하지 않음."""
+        monkeypatch.setattr(states, "_DEBUG_STATES", False)
+        ctx = LoopContext()
+
+        ctx.record_state(LoopState.CALLING_LLM)
+        assert ctx.state == LoopState.CALLING_LLM
+        assert ctx._state_history is None
+
+    def test_record_state(self, monkeypatch):
         """record_state() 메서드 테스트."""
+        monkeypatch.setattr(states, "_DEBUG_STATES", True)
         ctx = LoopContext()
-        assert len(ctx._state_history) == 0
+        assert ctx._state_history is None
 
         ctx.record_state(LoopState.RECEIVING_INPUT)
         assert ctx.state == LoopState.RECEIVING_INPUT
@@ -143,6 +159,17 @@ class TestLoopContext:
         assert ctx._state_history[0][1] == LoopState.RECEIVING_INPUT
         assert ctx._state_history[1][1] == LoopState.CALLING_LLM
 
+    def test_state_history_bounded(self, monkeypatch):
+        """상태 이력은 최근 STATE_HISTORY_LIMIT개만 유지."""
+        monkeypatch.setattr(states, "_DEBUG_STATES", True)
+        ctx = LoopContext()
+        for _ in range(STATE_HISTORY_LIMIT + 10):
+            ctx.record_state(LoopState.CALLING_LLM)
+        ctx.record_state(LoopState.COMPLETED)
+
+        assert len(ctx._state_history) == STATE_HISTORY_LIMIT
+        assert ctx._state_history[-1][1] == LoopState.COMPLETED
+
     def test_reset(self):
         """reset() 메서드 테스트."""
         ctx = LoopContext()
@@ -153,8 +180,8 @@ class TestLoopContext:
         ctx.current_turn = 5
         ctx.total_tool_calls = 10
         ctx.total_llm_calls = 3
-        ctx.start_time = time.time()
-        ctx.end_time = time.time()
+        ctx.start_time = time.monotonic_ns()
+        ctx.end_time = time.monotonic_ns()
         ctx.last_error = Exception("test")
         ctx.record_state(LoopState.COMPLETED)
 
@@ -170,7 +197,7 @@ class TestLoopContext:
         assert ctx.start_time is None
         assert ctx.end_time is None
         assert ctx.last_error is None
-        assert len(ctx._state_history) == 0
+        assert ctx._state_history is None
 
     def test_to_dict(self):
         """to_dict() 메서드 테스트."""
@@ -181,8 +208,8 @@ class TestLoopContext:
         ctx.max_turns = 20
         ctx.total_tool_calls = 5
         ctx.total_llm_calls = 2
-        ctx.start_time = time.time()
-        ctx.end_time = ctx.start_time + 0.5
+        ctx.start_time = time.monotonic_ns()
+        ctx.end_time = ctx.start_time + 500_000_000
 
         result = ctx.to_dict()
 
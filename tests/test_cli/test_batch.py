@@ -0,0 +1,66 @@
+"""Tests for the batch command."""
+
+import asyncio
+
+from click.testing import CliRunner
+
+from not_agent.cli.batch import _run_batch, batch
+
+
+class FakeAsyncProvider:
+    """동시 실행 수를 기록하는 비동기 프로바이더."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def simple_chat_async(self, prompt: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later prompts finish first
+        await asyncio.sleep(0.01 / int(prompt))
+        self.in_flight -= 1
+        if prompt == "3":
+            raise ValueError("boom")
+        return f"answer {prompt}"
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakeLimiter:
+    """대기하지 않는 리미터."""
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        return 0.0
+
+    def on_rate_limited(self) -> None:
+        pass
+
+
+class TestRunBatch:
+    """_run_batch 테스트."""
+
+    def test_results_in_prompt_order_within_concurrency(self):
+        """결과는 입력 순서대로, 동시 요청 수는 concurrency 이하로 유지된다."""
+        provider = FakeAsyncProvider()
+        prompts = [str(i) for i in range(1, 7)]
+
+        results = asyncio.run(_run_batch(provider, prompts, FakeLimiter(), 2))
+
+        assert results[:2] == ["answer 1", "answer 2"]
+        assert isinstance(results[2], ValueError)
+        assert results[3:] == ["answer 4", "answer 5", "answer 6"]
+        assert provider.max_in_flight == 2
+        assert provider.closed
+
+    def test_concurrency_must_be_positive(self, tmp_path):
+        """concurrency가 1보다 작으면 거부된다."""
+        prompts = tmp_path / "prompts.txt"
+        prompts.write_text("hello\n")
+
+        result = CliRunner().invoke(batch, [str(prompts), "--concurrency", "0"], obj={})
+
+        assert result.exit_code == 2
+        assert "--concurrency" in result.output
@@ -0,0 +1,117 @@
+"""Tests for shared CLI helpers."""
+
+import pytest
+
+from not_agent.cli import common
+from not_agent.cli.common import StreamingMarkdown, _stream_markdown
+
+
+class FakeClock:
+    """수동으로 진행하는 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(common.time, "monotonic", fake)
+    return fake
+
+
+def rendered(updates: list) -> list[str]:
+    """Markdown source of each rendered update."""
+    return [update.markup for update in updates]
+
+
+class TestStreamingMarkdown:
+    """StreamingMarkdown 테스트."""
+
+    def test_renders_on_block_boundaries(self, clock):
+        """문단 경계나 코드 펜스가 들어올 때만 다시 렌더링한다."""
+        updates: list = []
+        view = StreamingMarkdown(updates.append)
+
+        view.feed("Hello ")
+        view.feed("world\n")
+        assert updates == []
+
+        # Paragraph break split across deltas
+        view.feed("\nNext")
+        view.feed(" line ``")
+        view.feed("`py")
+        assert rendered(updates) == [
+            "Hello world\n\nNext",
+            "Hello world\n\nNext line ```py",
+        ]
+
+    def test_renders_after_delay(self, clock):
+        """경계 없이 긴 문단도 지연 시간이 지나면 렌더링한다."""
+        updates: list = []
+        view = StreamingMarkdown(updates.append)
+
+        view.feed("a")
+        clock.now = common._STREAM_MAX_RENDER_DELAY
+        view.feed("b")
+        view.feed("c")
+
+        assert rendered(updates) == ["ab"]
+
+    def test_finish_renders_full_text(self, clock):
+        """finish()는 전체 텍스트를 렌더링하고 반환한다."""
+        updates: list = []
+        view = StreamingMarkdown(updates.append)
+        view.feed("one\n\n")
+        view.feed("two")
+
+        assert view.finish() == "one\n\ntwo"
+        assert rendered(updates) == ["one\n\n", "one\n\ntwo"]
+
+    def test_not_incremental_renders_once(self, clock):
+        """incremental=False면 finish()에서 한 번만 렌더링한다."""
+        updates: list = []
+        view = StreamingMarkdown(updates.append, incremental=False)
+        for delta in ("a\n\n", "```", "b"):
+            view.feed(delta)
+        assert updates == []
+
+        view.finish()
+        assert rendered(updates) == ["a\n\n```b"]
+
+
+class FakeLive:
+    """update() 호출을 기록하는 Live 대용."""
+
+    def __init__(self) -> None:
+        self.updates: list = []
+
+    def update(self, renderable) -> None:
+        self.updates.append(renderable)
+
+
+class TestStreamMarkdown:
+    """_stream_markdown 테스트."""
+
+    def test_returns_full_text(self, monkeypatch):
+        """청크를 모두 이어 붙여 반환하고 마지막에 전체를 렌더링한다."""
+        monkeypatch.setattr(type(common.console), "is_terminal", property(lambda self: True))
+        live = FakeLive()
+
+        text = _stream_markdown(lambda: iter(["# Title\n", "\nbody"]), live)  # type: ignore[arg-type]
+
+        assert text == "# Title\n\nbody"
+        assert rendered(live.updates)[-1] == "# Title\n\nbody"
+        assert len(live.updates) == 2
+
+    def test_not_a_terminal_renders_once(self, monkeypatch):
+        """터미널이 아니면 최종 결과만 렌더링한다."""
+        monkeypatch.setattr(type(common.console), "is_terminal", property(lambda self: False))
+        live = FakeLive()
+
+        _stream_markdown(lambda: iter(["a\n\n", "b"]), live)  # type: ignore[arg-type]
+
+        assert rendered(live.updates) == ["a\n\nb"]
@@ -0,0 +1,155 @@
+"""Config Tests."""
+
+import json
+import os
+
+import pytest
+
+from not_agent.config import DEFAULT_CONFIG, Config, config as config_module
+
+
+@pytest.fixture(autouse=True)
+def fresh_env_cache():
+    """환경 변수 캐시를 테스트마다 초기화."""
+    config_module.clear_env_cache()
+    yield
+    config_module.clear_env_cache()
+
+
+class TestConfigFiles:
+    """설정 파일 로딩 테스트."""
+
+    def test_project_config_overrides_defaults(self, tmp_path, monkeypatch):
+        """프로젝트 설정이 기본값을 덮어쓴다."""
+        (tmp_path / ".not_agent.json").write_text(json.dumps({"max_turns": 5}))
+        monkeypatch.chdir(tmp_path)
+
+        assert Config().get("max_turns") == 5
+
+    def test_load_json_cached_until_mtime_changes(self, tmp_path, monkeypatch):
+        """mtime이 같으면 다시 파싱하지 않는다."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"debug": True}))
+        monkeypatch.setattr(config_module, "_FILE_CACHE", {})
+
+        first = config_module._load_json(path)
+        assert config_module._load_json(path) is first
+
+        path.write_text(json.dumps({"debug": False}))
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert config_module._load_json(path) == {"debug": False}
+
+    def test_load_json_reparsed_when_size_changes(self, tmp_path, monkeypatch):
+        """mtime이 같아도 크기가 바뀌면 다시 파싱한다."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"debug": True}))
+        monkeypatch.setattr(config_module, "_FILE_CACHE", {})
+        st = os.stat(path)
+        config_module._load_json(path)
+
+        path.write_text(json.dumps({"max_turns": 10}))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert config_module._load_json(path) == {"max_turns": 10}
+
+    def test_load_json_reparsed_when_replaced(self, tmp_path, monkeypatch):
+        """같은 크기와 mtime이라도 다른 파일로 교체되면 다시 파싱한다."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"debug": True}))
+        monkeypatch.setattr(config_module, "_FILE_CACHE", {})
+        st = os.stat(path)
+        config_module._load_json(path)
+
+        replacement = tmp_path / "new.json"
+        replacement.write_text(json.dumps({"debug": 1234}))
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        replacement.replace(path)
+        assert config_module._load_json(path) == {"debug": 1234}
+
+    def test_load_json_missing_and_invalid(self, tmp_path):
+        """없거나 잘못된 파일은 빈 dict."""
+        assert config_module._load_json(tmp_path / "missing.json") == {}
+
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert config_module._load_json(bad) == {}
+
+
+class TestConfigDefaults:
+    """기본값 테스트."""
+
+    def test_defaults_are_read_only(self):
+        """DEFAULT_CONFIG는 수정할 수 없다."""
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIG["debug"] = True  # type: ignore[index]
+
+    def test_instances_do_not_share_config(self, tmp_path, monkeypatch):
+        """Config 인스턴스는 서로 독립적이다."""
+        monkeypatch.chdir(tmp_path)
+        first, second = Config(), Config()
+        first.set("debug", True)
+
+        assert second.get("debug") is False
+        assert DEFAULT_CONFIG["debug"] is False
+
+
+class TestConfigEnv:
+    """환경 변수 설정 테스트."""
+
+    def test_parse_value(self):
+        """값 타입 변환."""
+        parse = Config._parse_value
+        config = Config()
+
+        assert parse(config, "Yes") is True
+        assert parse(config, "0") is False
+        assert parse(config, "-42") == -42
+        assert parse(config, "0.75") == 0.75
+        assert parse(config, "1e3") == 1000.0
+        assert parse(config, "claude-sonnet") == "claude-sonnet"
+        assert parse(config, "1.2.3") == "1.2.3"
+
+    @pytest.mark.parametrize("value", [
+        " 5", "1_000", "-0", "+7\n", "1_0.5", "1.", ".5", "2E-3",
+        "inf", "-Infinity", "nan", "1__0", "_1", "1_", "1._5", "e5", "0x10",
+        " true", "infinit", "",
+    ])
+    def test_parse_value_matches_int_float(self, value):
+        """int()/float()와 같은 값을 숫자로 받아들인다."""
+        config = Config()
+        expected: object = value
+        for convert in (int, float):
+            try:
+                expected = convert(value)
+                break
+            except ValueError:
+                pass
+
+        result = Config._parse_value(config, value)
+        if isinstance(expected, float) and expected != expected:  # nan
+            assert result != result
+        else:
+            assert result == expected
+            assert type(result) is type(expected)
+
+    def test_env_overrides(self, tmp_path, monkeypatch):
+        """NOT_AGENT_* 환경 변수가 설정을 덮어쓴다."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("NOT_AGENT_MAX_TURNS", "7")
+        monkeypatch.setenv("NOT_AGENT_DEBUG", "true")
+
+        config = Config()
+        assert config.get("max_turns") == 7
+        assert config.get("debug") is True
+
+    def test_env_cached_until_cleared(self, tmp_path, monkeypatch):
+        """환경 변수는 clear_env_cache() 전까지 캐시된다."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("NOT_AGENT_MAX_TURNS", "7")
+        assert Config().get("max_turns") == 7
+
+        monkeypatch.setenv("NOT_AGENT_MAX_TURNS", "9")
+        assert Config().get("max_turns") == 7
+
+        config_module.clear_env_cache()
+        assert Config().get("max_turns") == 9
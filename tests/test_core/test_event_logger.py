@@ -0,0 +1,63 @@
+"""Tests for EventLogger."""
+
+import io
+
+from rich.console import Console
+
+from not_agent.core import (
+    EventBus,
+    EventLogger,
+    LoopStartedEvent,
+    ToolExecutionCompletedEvent,
+    ToolExecutionStartedEvent,
+    TurnCompletedEvent,
+    TurnStartedEvent,
+)
+
+
+def _logger_output(*events, verbose: bool = True) -> str:
+    out = io.StringIO()
+    bus = EventBus()
+    EventLogger(console=Console(file=out, width=200), verbose=verbose).attach(bus)
+    for event in events:
+        bus.publish(event)
+    return out.getvalue()
+
+
+class TestEventLogger:
+    """EventLogger 테스트."""
+
+    def test_brackets_are_printed_literally(self):
+        """메시지 안의 대괄호는 마크업으로 해석되지 않는다."""
+        output = _logger_output(LoopStartedEvent(user_message="fix [bold]x[/bold]"))
+
+        assert "[LOOP START] fix [bold]x[/bold]" in output
+
+    def test_tool_started(self):
+        """도구 실행 시작이 기록된다."""
+        output = _logger_output(ToolExecutionStartedEvent(tool_name="read_file"))
+
+        assert "▶ read_file" in output
+
+    def test_long_message_is_truncated(self):
+        """80자를 넘는 메시지는 잘리고 말줄임표가 붙는다."""
+        assert "x" * 80 + "\n" in _logger_output(LoopStartedEvent(user_message="x" * 80))
+
+        output = _logger_output(LoopStartedEvent(user_message="y" * 81))
+        assert "y" * 80 + "..." in output
+        assert "y" * 81 not in output
+
+    def test_tools_summarized_per_turn(self):
+        """일반 모드에서는 도구 실행이 턴 종료 시 한 줄로 요약된다."""
+        output = _logger_output(
+            TurnStartedEvent(turn_number=1, max_turns=5),
+            ToolExecutionStartedEvent(tool_name="read_file"),
+            ToolExecutionCompletedEvent(tool_name="read_file", duration_ms=10),
+            ToolExecutionStartedEvent(tool_name="bash"),
+            ToolExecutionCompletedEvent(tool_name="bash", success=False, duration_ms=5),
+            TurnCompletedEvent(turn_number=1, tool_calls_count=2),
+            verbose=False,
+        )
+
+        assert "▶" not in output
+        assert "Turn 1 completed: 2 tool(s) (1 failed, 15ms): read_file, bash" in output
@@ -0,0 +1,215 @@
+"""Tests for EventBus."""
+
+import threading
+
+from not_agent.core import EventBus, LoopStartedEvent, TurnStartedEvent
+
+
+class TestEvent:
+    """Event 테스트."""
+
+    def test_timestamp(self):
+        """timestamp는 timestamp_ns에서 계산된다."""
+        from datetime import datetime, timedelta
+
+        before = datetime.now()
+        event = LoopStartedEvent()
+        after = datetime.now()
+
+        assert isinstance(event.timestamp_ns, int)
+        slack = timedelta(milliseconds=1)
+        assert before - slack <= event.timestamp <= after + slack
+
+    def test_events_are_slotted(self):
+        """이벤트 인스턴스는 __dict__가 없다."""
+        event = TurnStartedEvent(turn_number=1)
+
+        assert not hasattr(event, "__dict__")
+        assert event.event_type == "TurnStartedEvent"
+
+    def test_event_type_is_class_attribute(self):
+        """event_type은 클래스 속성으로 하위 클래스 이름을 가진다."""
+        assert TurnStartedEvent.event_type == "TurnStartedEvent"
+        assert LoopStartedEvent().event_type == "LoopStartedEvent"
+
+
+class TestEventBus:
+    """EventBus 테스트."""
+
+    def test_type_handlers_before_global(self):
+        """타입별 핸들러가 전역 핸들러보다 먼저 호출된다."""
+        bus = EventBus()
+        calls: list[str] = []
+        bus.subscribe_all(lambda e: calls.append("global"))
+        bus.subscribe(LoopStartedEvent, lambda e: calls.append("loop"))
+
+        bus.publish(LoopStartedEvent())
+        bus.publish(TurnStartedEvent())
+
+        assert calls == ["loop", "global", "global"]
+
+    def test_batch_handler_sync(self):
+        """동기 모드에서 배치 핸들러는 이벤트를 하나씩 받는다."""
+        bus = EventBus()
+        batches: list[int] = []
+        unsub = bus.subscribe_batch(lambda events: batches.append(len(events)))
+
+        bus.publish(LoopStartedEvent())
+        bus.publish(TurnStartedEvent())
+        unsub()
+        bus.publish(TurnStartedEvent())
+
+        assert batches == [1, 1]
+
+    def test_subscription_changes_after_publish(self):
+        """발행 후 구독/해제가 다음 발행에 반영된다."""
+        bus = EventBus()
+        calls: list[str] = []
+        unsub = bus.subscribe(LoopStartedEvent, lambda e: calls.append("a"))
+        bus.publish(LoopStartedEvent())
+
+        bus.subscribe(LoopStartedEvent, lambda e: calls.append("b"))
+        bus.publish(LoopStartedEvent())
+
+        unsub()
+        bus.publish(LoopStartedEvent())
+
+        bus.clear()
+        bus.publish(LoopStartedEvent())
+
+        assert calls == ["a", "a", "b", "b"]
+
+    def test_same_handler_subscribed_twice(self):
+        """같은 핸들러를 두 번 구독하면 각각 해제된다."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        def handler(event):
+            calls.append("h")
+
+        first = bus.subscribe(LoopStartedEvent, handler)
+        bus.subscribe(LoopStartedEvent, handler)
+        bus.publish(LoopStartedEvent())
+
+        first()
+        first()  # Unsubscribing twice is harmless
+        bus.publish(LoopStartedEvent())
+
+        assert calls == ["h", "h", "h"]
+
+    def test_handler_error_does_not_stop_others(self):
+        """핸들러 오류가 다른 핸들러를 막지 않는다."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(LoopStartedEvent, broken)
+        bus.subscribe_all(lambda e: calls.append("global"))
+        bus.publish(LoopStartedEvent())
+
+        assert calls == ["global"]
+
+
+class TestBackgroundEventBus:
+    """백그라운드 EventBus 테스트."""
+
+    def test_no_subscribers_skips_queue(self):
+        """구독자가 없으면 이벤트를 큐에 넣지 않고 스레드도 시작하지 않는다."""
+        bus = EventBus(background=True)
+        unsub = bus.subscribe_batch(lambda events: None)
+        unsub()
+        unsub()  # Unsubscribing twice does not go below zero
+        bus.publish(LoopStartedEvent())
+
+        assert bus._worker is None
+        assert not bus._pending
+
+    def test_handlers_run_off_thread_in_order(self):
+        """핸들러는 다른 스레드에서 순서대로 호출된다."""
+        bus = EventBus(background=True)
+        seen: list[tuple[int, bool]] = []
+        main = threading.get_ident()
+        bus.subscribe(
+            TurnStartedEvent,
+            lambda e: seen.append((e.turn_number, threading.get_ident() == main)),
+        )
+
+        for turn in range(5):
+            bus.publish(TurnStartedEvent(turn_number=turn))
+        bus.flush()
+
+        assert seen == [(turn, False) for turn in range(5)]
+
+    def test_full_queue_drops_oldest_events(self, monkeypatch):
+        """큐가 가득 차면 가장 오래된 이벤트를 버리고 센다."""
+        from not_agent.core import events
+
+        monkeypatch.setattr(events, "EVENT_QUEUE_SIZE", 1)
+        bus = EventBus(background=True)
+        started, release = threading.Event(), threading.Event()
+
+        def handler(event):
+            started.set()
+            release.wait(5)
+
+        bus.subscribe(TurnStartedEvent, handler)
+        seen: list[int] = []
+        bus.subscribe(TurnStartedEvent, lambda e: seen.append(e.turn_number))
+        bus.publish(TurnStartedEvent(turn_number=0))
+        assert started.wait(5)
+
+        # One event is being handled and one fits in the queue, so the
+        # older of the waiting events are discarded
+        for turn in range(1, 4):
+            bus.publish(TurnStartedEvent(turn_number=turn))
+        release.set()
+        bus.flush()
+
+        assert bus.dropped == 2
+        assert seen == [0, 3]
+
+    def test_batch_handlers_receive_queued_events_together(self):
+        """배치 핸들러는 대기 중인 이벤트를 한 번에 받는다."""
+        bus = EventBus(background=True)
+        started, release = threading.Event(), threading.Event()
+        batches: list[list[int]] = []
+
+        def block(event):
+            if event.turn_number == 0:
+                started.set()
+                release.wait(5)
+
+        bus.subscribe(TurnStartedEvent, block)
+        bus.subscribe_batch(lambda events: batches.append([e.turn_number for e in events]))
+
+        bus.publish(TurnStartedEvent(turn_number=0))
+        assert started.wait(5)
+        for turn in range(1, 4):
+            bus.publish(TurnStartedEvent(turn_number=turn))
+        release.set()
+        bus.flush()
+
+        assert batches == [[0], [1, 2, 3]]
+
+    def test_subscription_changes_while_dispatching(self):
+        """디스패치 중 구독이 바뀌어도 작업 스레드가 살아 있고, 해제된 핸들러는 더 호출되지 않는다."""
+        bus = EventBus(background=True)
+        bus.subscribe_all(lambda e: None)
+        removed: list[int] = []
+        unsub_removed = bus.subscribe(TurnStartedEvent, lambda e: removed.append(e.turn_number))
+
+        for turn in range(2000):
+            bus.publish(TurnStartedEvent(turn_number=turn))
+            unsub = bus.subscribe(TurnStartedEvent, lambda e: None)
+            bus.subscribe_batch(lambda events: None)()
+            unsub()
+            if turn == 1000:
+                unsub_removed()
+                bus.flush()
+                count = len(removed)
+        bus.flush()
+
+        assert bus._worker is not None and bus._worker.is_alive()
+        assert len(removed) == count
@@ -21,6 +21,14 @@ class TestPermissionRule:
         assert not rule.matches("read", {})
         assert not rule.matches("edit", {})
 
+    def test_rule_is_immutable(self):
+        """규칙은 생성 후 바꿀 수 없다."""
+        rule = PermissionRule(tool_pattern="read", permission=Permission.ALLOW)
+
+        with pytest.raises(AttributeError):
+            rule.path_pattern = "*.py"  # type: ignore[misc]
+        assert rule.matches("read", {})
+
     def test_tool_pattern_wildcard(self):
         """와일드카드 패턴 매칭."""
         rule = PermissionRule(tool_pattern="*", permission=Permission.ASK)
@@ -191,6 +199,75 @@ class TestPermissionManager:
         assert manager.evaluate("read", {}) == Permission.ALLOW
         assert manager.evaluate("write", {}) == Permission.ASK
 
+    def test_add_rule_keeps_insertion_order_for_equal_priority(self):
+        """같은 우선순위는 추가 순서 유지."""
+        manager = PermissionManager(enabled=True, use_default_rules=False)
+        first = PermissionRule(tool_pattern="write", permission=Permission.DENY)
+        second = PermissionRule(tool_pattern="write", permission=Permission.ALLOW)
+        manager.add_rule(first)
+        manager.add_rule(PermissionRule(tool_pattern="*", priority=-10))
+        manager.add_rule(second)
+
+        assert manager.rules[:2] == (first, second)
+        assert manager.evaluate("write", {}) == Permission.DENY
+
+    def test_compiled_matcher_matches_rule_order(self):
+        """생성된 매처가 규칙 순차 평가와 동일한 결과."""
+        manager = PermissionManager(enabled=True, rules=[
+            PermissionRule(tool_pattern="web_*", permission=Permission.ALLOW),
+            PermissionRule(tool_pattern="edit", path_pattern="src/[ab]*.py",
+                           permission=Permission.DENY, priority=5),
+        ])
+        tools = ["read", "write", "edit", "bash", "web_fetch"]
+        contexts = [
+            {},
+            {"file_path": "main.py"},
+            {"file_path": "src/a.py"},
+            {"path": "/tmp/out.txt"},
+            {"file_path": "/repo/test_x.py"},
+            {"command": "rm -rf /"},
+            {"command": "python -m pytest -q"},
+            {"command": "ls"},
+        ]
+        for tool in tools:
+            for context in contexts:
+                expected = next(
+                    (r.permission for r in manager.rules if r.matches(tool, context)),
+                    Permission.ASK,
+                )
+                assert manager.evaluate(tool, context) == expected, (tool, context)
+
+    def test_add_rule_after_evaluate(self):
+        """평가 후 규칙 추가 시 재컴파일."""
+        manager = PermissionManager(enabled=True)
+        assert manager.evaluate("write", {"file_path": "main.py"}) == Permission.ASK
+
+        manager.add_rule(PermissionRule(tool_pattern="write", permission=Permission.ALLOW))
+        assert manager.evaluate("write", {"file_path": "main.py"}) == Permission.ALLOW
+
+    def test_default_rules_shared_until_modified(self):
+        """기본 규칙은 인스턴스 간 공유, 규칙 추가 시 분리."""
+        first = PermissionManager(enabled=True)
+        second = PermissionManager(enabled=True)
+        assert first.rules is second.rules
+
+        first.add_rule(PermissionRule(tool_pattern="write", permission=Permission.ALLOW))
+        assert first.rules is not second.rules
+        assert len(second.rules) == len(PermissionManager.DEFAULT_RULES)
+        assert second.evaluate("write", {"file_path": "main.py"}) == Permission.ASK
+
+    def test_rules_are_read_only(self):
+        """rules는 튜플이라 직접 수정할 수 없고 다른 인스턴스에 영향이 없다."""
+        manager = PermissionManager(enabled=True)
+        with pytest.raises(AttributeError):
+            manager.rules.append(  # type: ignore[attr-defined]
+                PermissionRule(tool_pattern="write", permission=Permission.ALLOW)
+            )
+
+        assert PermissionManager(enabled=True).evaluate(
+            "write", {"file_path": "main.py"}
+        ) == Permission.ASK
+
     def test_custom_rules(self):
         """사용자 정의 규칙 테스트."""
         custom_rules = [
@@ -229,6 +306,16 @@ class TestPermissionManager:
         assert len(history) == 1
         assert history[0][1] == Permission.ALLOW
 
+    def test_check_precomputed_decision_follows_added_rules(self):
+        """컨텍스트 없는 도구 결정 캐시가 규칙 추가를 반영."""
+        manager = PermissionManager(enabled=True)
+        assert manager.check("read", "Reading", {}) is True
+
+        manager.add_rule(PermissionRule(
+            tool_pattern="read", permission=Permission.DENY, priority=200,
+        ))
+        assert manager.check("read", "Reading", {}) is False
+
     def test_check_auto_deny(self):
         """자동 거부 테스트."""
         manager = PermissionManager(enabled=True)
@@ -241,6 +328,21 @@ class TestPermissionManager:
         assert len(history) == 1
         assert history[0][1] == Permission.DENY
 
+    def test_format_diff(self):
+        """diff 표시 형식."""
+        manager = PermissionManager(enabled=True)
+        diff = "--- a.py\n+++ b.py\n@@ -1 +1 @@\n-old\n+new\n same"
+
+        assert manager._format_diff(diff) == (
+            "  --- a.py\n"
+            "  +++ b.py\n"
+            "  @@ -1 +1 @@\n"
+            "  - old\n"
+            "  + new\n"
+            "     same"
+        )
+        assert manager._format_diff("") == ""
+
     def test_from_config(self):
         """설정에서 생성 테스트."""
         config = Config()
@@ -269,6 +371,27 @@ class TestPermissionManager:
         manager.clear_history()
         assert len(manager.get_history()) == 0
 
+    def test_history_formatted_on_read(self):
+        """이력 문자열은 조회 시점에 생성."""
+        manager = PermissionManager(enabled=True)
+        manager.check("read", "Reading file1.txt", {})
+
+        assert manager._hist_tool == ["read"]
+        assert manager._hist_details == ["Reading file1.txt"]
+        assert manager.get_history() == [("read: Reading file1.txt", Permission.ALLOW)]
+
+    def test_history_property_is_read_only(self):
+        """history는 튜플 스냅샷이며 record()/clear_history()로만 바뀐다."""
+        manager = PermissionManager(enabled=True)
+        manager.record("write", "Writing a.txt", Permission.DENY)
+
+        assert manager.history == (("write: Writing a.txt", Permission.DENY),)
+        with pytest.raises(AttributeError):
+            manager.history.clear()  # type: ignore[attr-defined]
+
+        manager.clear_history()
+        assert manager.history == ()
+
 
 class TestApprovalManagerCompatibility:
     """ApprovalManager 호환성 테스트."""
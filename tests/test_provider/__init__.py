@@ -0,0 +1 @@
+"""Provider tests."""
@@ -0,0 +1,31 @@
+"""Tests for BaseProvider."""
+
+from anthropic.types import TextBlock
+
+from not_agent.provider import BaseProvider, ProviderResponse
+
+
+class EchoProvider(BaseProvider):
+    """chat()만 구현한 프로바이더. 받은 메시지를 그대로 돌려준다."""
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    def chat(self, messages, system=None, tools=None, max_tokens=16384):
+        text = f"{system}: {messages[-1]['content']}"
+        return ProviderResponse(
+            content=[TextBlock(type="text", text=text)], stop_reason="end_turn"
+        )
+
+
+class TestBaseProvider:
+    """BaseProvider 기본 구현 테스트."""
+
+    def test_simple_chat(self):
+        """simple_chat은 chat()의 텍스트 블록을 이어 붙인다."""
+        assert EchoProvider().simple_chat("hi", system="sys") == "sys: hi"
+
+    def test_stream_simple_chat(self):
+        """스트리밍을 지원하지 않으면 응답 전체를 한 번에 내보낸다."""
+        assert list(EchoProvider().stream_simple_chat("hi")) == ["None: hi"]
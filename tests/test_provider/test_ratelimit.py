@@ -0,0 +1,133 @@
+"""Tests for SlidingWindowLimiter."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from anthropic import RateLimitError
+
+from not_agent.provider import ratelimit
+from not_agent.provider.ratelimit import SlidingWindowLimiter
+
+
+class FakeClock:
+    """수동으로 진행하는 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(rpm: int, tpm: int) -> tuple[SlidingWindowLimiter, FakeClock]:
+    clock = FakeClock()
+    return SlidingWindowLimiter(rpm, tpm, clock=clock, sleep=clock.sleep), clock
+
+
+class TestSlidingWindowLimiter:
+    """SlidingWindowLimiter 테스트."""
+
+    def test_under_limit_no_wait(self):
+        """한도 내 요청은 대기하지 않음."""
+        limiter, clock = make_limiter(rpm=3, tpm=1000)
+        for _ in range(3):
+            assert limiter.acquire(100) == 0
+        assert clock.sleeps == []
+
+    def test_request_limit_waits_for_window(self):
+        """요청 수 초과 시 가장 오래된 요청이 만료될 때까지 대기."""
+        limiter, clock = make_limiter(rpm=2, tpm=1000)
+        limiter.acquire()
+        clock.now = 10.0
+        limiter.acquire()
+        assert limiter.acquire() == 50.0
+        assert clock.now == 60.0
+
+    def test_token_limit_waits_for_window(self):
+        """토큰 예산 초과 시 충분한 토큰이 만료될 때까지 대기."""
+        limiter, clock = make_limiter(rpm=100, tpm=1000)
+        limiter.acquire(600)
+        clock.now = 5.0
+        limiter.acquire(300)
+        assert limiter.acquire(200) == 55.0
+
+    def test_oversized_request_allowed_on_empty_window(self):
+        """예산보다 큰 단일 요청도 창이 비어 있으면 통과."""
+        limiter, _ = make_limiter(rpm=10, tpm=100)
+        assert limiter.acquire(500) == 0
+
+    def test_aimd(self):
+        """429 시 rpm 절반, 이후 분당 1씩 회복."""
+        limiter, clock = make_limiter(rpm=8, tpm=1000)
+        limiter.on_rate_limited()
+        assert limiter.rpm == 4
+
+        clock.now = 120.0
+        limiter.acquire()
+        assert limiter.rpm == 6
+
+        clock.now = 600.0
+        limiter.acquire()
+        assert limiter.rpm == 8
+
+    def test_acquire_async_waits(self, monkeypatch):
+        """acquire_async()도 동일한 창 규칙으로 대기."""
+        limiter, clock = make_limiter(rpm=1, tpm=1000)
+
+        async def fake_sleep(seconds: float) -> None:
+            clock.sleep(seconds)
+
+        monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+
+        async def run() -> list[float]:
+            return [await limiter.acquire_async(), await limiter.acquire_async()]
+
+        assert asyncio.run(run()) == [0, 60.0]
+
+
+def rate_limit_error(retry_after: str | None = None):
+    """RateLimitError with a minimal stand-in for the HTTP response."""
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = SimpleNamespace(status_code=429, headers=headers, request=None)
+    return RateLimitError("rate limited", response=response, body=None)  # type: ignore[arg-type]
+
+
+class TestCallWithBackoff:
+    """call_with_backoff 테스트."""
+
+    def test_retries_only_the_call(self):
+        """레이트 리밋 시 같은 호출만 재시도하고 retry-after를 따른다."""
+        calls: list[int] = []
+        waits: list[tuple[float, int]] = []
+
+        def request(x: int) -> int:
+            calls.append(x)
+            if len(calls) == 1:
+                raise rate_limit_error("2")
+            return x * 2
+
+        result = ratelimit.call_with_backoff(
+            request, 21, wait=lambda delay, attempt: waits.append((delay, attempt))
+        )
+
+        assert result == 42
+        assert calls == [21, 21]
+        assert waits == [(2.0, 0)]
+
+    def test_gives_up_after_attempts(self):
+        """시도 횟수를 모두 쓰면 마지막 오류를 다시 발생시킨다."""
+        calls: list[None] = []
+
+        def request() -> None:
+            calls.append(None)
+            raise rate_limit_error()
+
+        with pytest.raises(RateLimitError):
+            ratelimit.call_with_backoff(request, wait=lambda delay, attempt: None)
+        assert len(calls) == ratelimit.BACKOFF_ATTEMPTS
@@ -0,0 +1,45 @@
+"""Tests for the not_agent.tools package."""
+
+import subprocess
+import sys
+
+import not_agent.tools as tools
+from not_agent.tools import TodoManager, get_all_tools
+from not_agent.tools.registry import _BUILTIN_TOOLS
+
+
+class TestToolsPackage:
+    """tools 패키지 테스트."""
+
+    def test_import_does_not_load_tool_modules(self):
+        """패키지 import만으로는 도구 모듈을 불러오지 않는다."""
+        code = (
+            "import sys, not_agent.tools; "
+            "print(any(m in sys.modules for m in "
+            "('not_agent.tools.bash', 'not_agent.tools.web_fetch')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_lazy_attribute(self):
+        """도구 클래스는 처음 접근할 때 불러온다."""
+        from not_agent.tools.bash import BashTool
+
+        assert tools.BashTool is BashTool
+        assert "WebFetchTool" in dir(tools)
+
+    def test_lazy_attributes_cover_builtin_tools(self):
+        """레지스트리의 기본 도구 클래스는 모두 패키지 속성으로 접근할 수 있다."""
+        for spec in _BUILTIN_TOOLS.values():
+            module, _, class_name = spec.partition(":")
+            assert tools._lazy_imports[class_name] == module
+        assert tools._lazy_imports["TodoManager"] == "not_agent.tools.todo"
+
+    def test_get_all_tools(self):
+        """get_all_tools는 등록된 도구와 Todo 도구를 모두 반환한다."""
+        names = {tool.name for tool in get_all_tools(TodoManager())}
+
+        assert {"bash", "read", "write", "edit"} <= names
+        assert len(names) == 11
@@ -0,0 +1,51 @@
+"""Tests for ToolRegistry."""
+
+import pytest
+
+from not_agent.tools import ToolRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Empty registry state, restored after the test."""
+    monkeypatch.setattr(ToolRegistry, "_tools", {})
+    monkeypatch.setattr(ToolRegistry, "_lazy", {})
+    monkeypatch.setattr(ToolRegistry, "_instances", {})
+    return ToolRegistry
+
+
+class TestToolRegistry:
+    """ToolRegistry 테스트."""
+
+    def test_lazy_tool_loaded_on_get(self, registry):
+        """지연 등록된 도구는 get 호출 시 불러온다."""
+        registry.register_lazy("glob", "not_agent.tools.glob_tool:GlobTool")
+
+        assert registry.list_tools() == ["glob"]
+        assert registry.is_registered("glob")
+        assert "glob" not in registry._tools
+
+        tool = registry.get("glob")
+        assert tool.name == "glob"
+        assert registry.get("glob") is tool
+
+    def test_lazy_tool_without_decorator(self, registry):
+        """데코레이터 없이도 지연 등록된 클래스가 등록된다."""
+        registry.register_lazy("glob_alias", "not_agent.tools.glob_tool:GlobTool")
+
+        assert registry.get_tool_class("glob_alias").__name__ == "GlobTool"
+
+    def test_unknown_tool(self, registry):
+        """등록되지 않은 도구는 KeyError를 발생시킨다."""
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+    def test_clear_restores_builtin_tools(self, registry):
+        """clear는 사용자 등록 도구를 지우고 기본 도구 목록을 되살린다."""
+        registry.register_lazy("glob_alias", "not_agent.tools.glob_tool:GlobTool")
+
+        registry.clear()
+
+        assert not registry.is_registered("glob_alias")
+        assert "bash" in registry.list_tools()
+        assert registry.get("glob").name == "glob"